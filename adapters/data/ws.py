@@ -4,6 +4,12 @@ import logging
 import time
 import websockets
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Optional - stdlib json otherwise
+    _loads = json.loads
+
 class BinanceUSWebSocket:
     def __init__(self, symbol: str = "btcusdt"):
         self.uri = f"wss://stream.binance.us:9443/ws/{symbol}@depth@100ms/{symbol}@trade"
@@ -23,7 +29,7 @@ class BinanceUSWebSocket:
     async def _listen(self):
         try:
             async for message in self.ws:
-                data = json.loads(message)
+                data = _loads(message)
                 await self._handle_message(data)
         except Exception as e:
             self.logger.error(f"Binance.US listen error: {e}")
@@ -85,7 +91,7 @@ class KrakenWebSocket:
     async def _listen(self):
         try:
             async for message in self.ws:
-                data = json.loads(message)
+                data = _loads(message)
                 if isinstance(data, list) and len(data) > 3:
                     book_data = {
                         'exchange': 'kraken',
@@ -134,7 +140,7 @@ class CoinbaseWebSocket:
     async def _listen(self):
         try:
             async for message in self.ws:
-                data = json.loads(message)
+                data = _loads(message)
                 if data.get('channel') == 'level2':
                     book_data = {
                         'exchange': 'coinbase',
@@ -0,0 +1,37 @@
+"""
+Per-endpoint circuit breaker for adapter network calls
+"""
+import functools
+import time
+from typing import Any, Callable, Tuple, Type
+
+
+def circuit_breaker(default: Callable[[], Any], errors: Tuple[Type[BaseException], ...],
+                    failure_ttl: float = 10, half_open_after: float = 30):
+    """Return default() instead of calling a failing endpoint again too soon.
+
+    After n consecutive failures the endpoint is skipped for
+    min(failure_ttl * 2**(n-1), half_open_after) seconds, then retried once.
+    Only `errors` trip the breaker - anything else propagates.
+    State is per adapter and method, not per argument, so only wrap reads
+    whose default is safe for every caller (never order actions).
+    """
+    def decorator(fn):
+        name = fn.__name__
+
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            breakers = self.__dict__.setdefault('_breakers', {})
+            last_failure, failures = breakers.get(name, (0.0, 0))
+            if failures and time.monotonic() - last_failure < min(failure_ttl * 2 ** (failures - 1), half_open_after):
+                return default()
+            try:
+                result = await fn(self, *args, **kwargs)
+            except errors:
+                breakers[name] = (time.monotonic(), failures + 1)
+                return default()
+            if failures:
+                breakers.pop(name, None)
+            return result
+        return wrapper
+    return decorator
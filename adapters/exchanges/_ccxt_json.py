@@ -0,0 +1,19 @@
+"""
+orjson response decoding for ccxt clients
+"""
+try:
+    import orjson
+except ImportError:  # Optional fast path, stdlib json via ccxt otherwise
+    orjson = None
+
+
+class OrjsonParseMixin:
+    """List ahead of the ccxt exchange class so large payloads decode with orjson when available"""
+
+    def parse_json(self, http_response):
+        if orjson is None:
+            return super().parse_json(http_response)
+        try:
+            return orjson.loads(http_response)
+        except orjson.JSONDecodeError:
+            return super().parse_json(http_response)
@@ -0,0 +1,22 @@
+"""
+Exchange credentials read once from the environment
+"""
+import functools
+import os
+from typing import Dict, Optional
+
+from config.bootstrap import load_env
+
+_KEYS = (
+    'KRAKEN_KEY', 'KRAKEN_SECRET',
+    'BINANCEUS_KEY', 'BINANCEUS_SECRET',
+    'COINBASE_KEY', 'COINBASE_SECRET',
+    'COINBASEADV_KEY', 'COINBASEADV_SECRET', 'COINBASEADV_PASSPHRASE',
+)
+
+
+@functools.lru_cache(maxsize=None)
+def get_env() -> Dict[str, Optional[str]]:
+    """Credential snapshot - .env is parsed at most once per process (see config.bootstrap)"""
+    load_env()
+    return {k: os.environ.get(k) for k in _KEYS}
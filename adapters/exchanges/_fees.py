@@ -0,0 +1,27 @@
+"""
+Trading-fee cache shared by the ccxt-backed exchange adapters
+"""
+import time
+from decimal import Decimal
+from typing import Any, Dict, Optional
+
+
+class TradingFeeCache:
+    """fetch_trading_fees() as {symbol: {'maker', 'taker'}} Decimals, converted once per refresh"""
+    __slots__ = ('ttl', 'default', '_fees', '_fetched_at')
+
+    def __init__(self, ttl: float, default: Dict[str, Decimal]):
+        self.ttl = ttl
+        self.default = default  # Answer for symbols the exchange doesn't list
+        self._fees: Optional[Dict[str, Dict[str, Decimal]]] = None
+        self._fetched_at = 0.0
+
+    async def get(self, client: Any, symbol: str) -> Dict[str, Decimal]:
+        if self._fees is None or time.time() - self._fetched_at >= self.ttl:
+            self._fees = {
+                pair: {'maker': Decimal(str(f['maker'])), 'taker': Decimal(str(f['taker']))}
+                for pair, f in (await client.fetch_trading_fees()).items()
+            }
+            self._fetched_at = time.time()
+        # Keyed by symbol so one pair's fees never answer for another
+        return self._fees.get(symbol, self.default)
@@ -0,0 +1,12 @@
+"""
+Order-book level rows -> NumPy buffers, shared by the exchange adapters
+"""
+from typing import Any, Sequence
+
+import numpy as np
+
+
+def levels_array(rows: Sequence[Sequence[Any]], columns: int) -> np.ndarray:
+    # [[price, amount, ...], ...] with `columns` fields per row -> (n, 2) float64 price/amount;
+    # NumPy parses numeric strings in C
+    return np.array(rows, dtype=np.float64).reshape(-1, columns)[:, :2]
@@ -0,0 +1,22 @@
+"""
+Last-price Decimal cache shared by the exchange adapters
+"""
+from decimal import Decimal
+from typing import Any, Dict, Tuple
+
+
+class LastPriceCache:
+    """Per-market (raw last, Decimal) pair - quiet markets repeat the same last price, so the parse is skipped"""
+    __slots__ = ('_last',)
+
+    def __init__(self):
+        self._last: Dict[str, Tuple[Any, Decimal]] = {}
+
+    def decimal(self, market: str, raw: Any) -> Decimal:
+        last = self._last.get(market)
+        if last is not None and last[0] == raw:
+            return last[1]
+        # str() first: a ccxt float parses to its short form, not the full binary expansion
+        value = Decimal(str(raw))
+        self._last[market] = (raw, value)
+        return value
@@ -0,0 +1,10 @@
+"""
+Symbol -> exchange market id conversions shared by the adapters
+"""
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def product_id(symbol: str) -> str:
+    # 'BTC/USD' -> 'BTC-USD' (Coinbase product id), computed once per distinct symbol
+    return symbol.replace('/', '-')
@@ -0,0 +1,90 @@
+"""
+Local order books kept from an exchange's WebSocket book feed
+"""
+import asyncio
+import heapq
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+Level = Tuple[str, str]  # (price, qty) wire strings, so reads build exact Decimals
+
+
+class LocalBooks:
+    """{market: (bids, asks)} keyed by float price, fed by one WebSocket task.
+
+    A market is readable from its snapshot until the next disconnect - top()
+    returns None outside that window and callers fall back to REST.
+    """
+    __slots__ = ('depth', '_books', '_task')
+
+    def __init__(self, depth: Optional[int] = None):
+        self.depth = depth  # Levels kept per side; None keeps whatever the feed sends
+        self._books: Dict[str, Tuple[Dict[float, Level], Dict[float, Level]]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def apply(self, market: str, bids: Iterable[Level], asks: Iterable[Level], snapshot: bool = False) -> None:
+        if snapshot:
+            book = self._books[market] = ({}, {})
+        else:
+            book = self._books.get(market)
+            if book is None:
+                return  # Updates before the snapshot can't be placed
+        for side, levels, best in ((book[0], bids, heapq.nlargest), (book[1], asks, heapq.nsmallest)):
+            for price_s, qty_s in levels:
+                price = float(price_s)
+                if float(qty_s) == 0.0:
+                    side.pop(price, None)
+                else:
+                    side[price] = (price_s, qty_s)
+            if self.depth is not None and len(side) > self.depth:
+                # The feed only maintains the subscribed depth - levels pushed out of range are stale
+                keep = set(best(self.depth, side))
+                for price in [p for p in side if p not in keep]:
+                    del side[price]
+
+    def top(self, market: str, limit: int) -> Optional[Tuple[List[Level], List[Level]]]:
+        book = self._books.get(market)
+        if book is None:
+            return None
+        bids, asks = book
+        return [bids[p] for p in heapq.nlargest(limit, bids)], [asks[p] for p in heapq.nsmallest(limit, asks)]
+
+    def reset(self, markets: Optional[Iterable[str]] = None) -> None:
+        if markets is None:
+            self._books.clear()
+            return
+        for market in markets:
+            self._books.pop(market, None)
+
+    def start(self, uri: str, subscribe_msg: str, markets: List[str],
+              on_message: Callable[[str], None], reconnect: float) -> None:
+        # One feed per instance; a second call while it runs is a no-op
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(uri, subscribe_msg, markets, on_message, reconnect))
+
+    def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._books.clear()
+
+    async def _run(self, uri: str, subscribe_msg: str, markets: List[str],
+                   on_message: Callable[[str], None], reconnect: float) -> None:
+        while True:
+            try:
+                async with websockets.connect(uri, max_size=None) as ws:
+                    await ws.send(subscribe_msg)
+                    async for message in ws:
+                        on_message(message)
+            except (websockets.exceptions.WebSocketException, OSError):
+                pass
+            except Exception as e:  # A frame on_message can't parse - resubscribe for a fresh snapshot
+                logger.warning(f"Book feed {uri} dropped after a bad message: {e!r}")
+            finally:
+                # Missed updates make the local book wrong - drop it (REST fallback) until the next snapshot
+                self.reset(markets)
+            await asyncio.sleep(reconnect)
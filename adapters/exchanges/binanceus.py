@@ -1,22 +1,126 @@
+import json
+import time
+
 import ccxt.async_support as ccxt
 from decimal import Decimal
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 
 from exchanges.wrappers import ExchangeAdapter
 from domain.values import Price, Amount, Symbol         #<<---- NEEDS FIXING!!
 from binance.spot import Spot as BinanceSpot
+from adapters.exchanges._prices import LastPriceCache
+from adapters.exchanges._ccxt_json import OrjsonParseMixin
+
+_MARKETS_TTL = 3600  # Markets/precisions change a few times a day at most
+_FEES_TTL = 300      # Fee tiers can move with 30d volume
+_QUOTES = frozenset({'USDT', 'USDC', 'USD'})
+_D0 = Decimal('0')
+
+# Raw BinanceUS order states -> domain OrderStatus values
+_BINANCE_STATUS_MAP = {
+    'NEW': 'open',
+    'PARTIALLY_FILLED': 'open',
+    'PENDING_CANCEL': 'open',
+    'FILLED': 'closed',
+    'CANCELED': 'canceled',
+    'EXPIRED': 'canceled',
+    'REJECTED': 'failed'
+}
+_binance_status = _BINANCE_STATUS_MAP.get
+
+# (order type, params template) keyed on "has a limit price"
+_ORDER_TEMPLATES = {
+    False: ('market', {}),
+    True: ('limit', {'timeInForce': 'GTC'})
+}
+
+
+
+class AssetNet(NamedTuple):
+    withdraw_fee: Decimal
+    withdraw_enabled: bool
+    deposit_enabled: bool
+    min_withdraw: Decimal
+
+
+class Fees:
+    # Keeps the raw ccxt rates and only builds (then memoizes) the Decimal on read
+    __slots__ = ('maker_rate', 'taker_rate', '_maker', '_taker')
+
+    def __init__(self, maker_rate: Any, taker_rate: Any):
+        self.maker_rate = maker_rate
+        self.taker_rate = taker_rate
+        self._maker = None
+        self._taker = None
+
+    @property
+    def maker(self) -> Decimal:
+        if self._maker is None:
+            self._maker = Decimal(str(self.maker_rate))
+        return self._maker
+
+    @property
+    def taker(self) -> Decimal:
+        if self._taker is None:
+            self._taker = Decimal(str(self.taker_rate))
+        return self._taker
+
+    def __getitem__(self, key: str) -> Decimal:
+        # Dict-style fees['maker'] access for existing callers
+        if key == 'maker':
+            return self.maker
+        if key == 'taker':
+            return self.taker
+        raise KeyError(key)
+
+
+_DEFAULT_FEES = Fees('0.001', '0.001')  # BinanceUS base tier, used until fees load
+
+
+def _payload_hash(raw: Any) -> int:
+    return hash(json.dumps(raw, sort_keys=True, default=str))
+
+
+def _to_levels(rows: List[List[Any]], _dec=Decimal) -> List[Dict[str, Decimal]]:
+    # Single tight pass over [price, amount, ...] rows; Decimal bound as a local
+    return [{'price': _dec(p[0]), 'amount': _dec(p[1])} for p in rows]
+
+
+class _BinanceUSClient(OrjsonParseMixin, ccxt.binanceus):
+    # exchangeInfo is several hundred KB - decode it with orjson when available
+    pass
+
 
 class BinanceUSAdapter(ExchangeAdapter):
+    name = "binanceus"
+
+    # One ccxt client (and aiohttp pool / rate limiter) per API key, shared by every adapter instance
+    _clients: Dict[tuple, _BinanceUSClient] = {}
+
     def __init__(self, config: Dict[str, Any]):
-        self.client = ccxt.binanceus({
+        key = (config['api_key'], 'binanceus')
+        self.client = type(self)._clients.get(key) or type(self)._clients.setdefault(key, _BinanceUSClient({
             'apiKey': config['api_key'],
             'secret': config['api_secret'],
             'enableRateLimit': True,
             'options': {'defaultType': 'spot'}
-        })
+        }))
+        # Conditional refresh: on TTL expiry we re-fetch, but only rebuild the
+        # derived views when the raw payload actually changed upstream
+        self._markets_ts = 0.0
+        self._markets_hash = None
+        self._market_metadata: Dict[str, Dict[str, Any]] = {}
+        self._market_precisions: Dict[str, Tuple[Any, Any]] = {}
+        self._supported_pairs: List[Symbol] = []
+        self._assets_ts = 0.0
+        self._asset_networks: Dict[Tuple[str, str], AssetNet] = {}
+        self._fees_ts = 0.0
+        self._fees_hash = None
+        self._fees: Dict[str, Fees] = {}
+        self._last_prices = LastPriceCache()  # Keyed by market id
 
     def get_name(self) -> str:
-        return "binanceus"
+        return self.name
 
     async def get_balance(self, asset: str) -> Decimal:
         balance = await self.client.fetch_balance()
@@ -24,31 +128,102 @@ class BinanceUSAdapter(ExchangeAdapter):
 
     async def get_order_book(self, symbol: Symbol, limit: int = 5) -> Dict[str, List[Dict[str, Decimal]]]:
         book = await self.client.fetch_order_book(str(symbol).replace('/', ''), limit)
-        return {
-            'bids': [{'price': Decimal(p[0]), 'amount': Decimal(p[1])} for p in book['bids']],
-            'asks': [{'price': Decimal(p[0]), 'amount': Decimal(p[1])} for p in book['asks']]
-        }
+        return {'bids': _to_levels(book['bids']), 'asks': _to_levels(book['asks'])}
 
     async def get_ticker_price(self, symbol: Symbol) -> Price:
-        ticker = await self.client.fetch_ticker(str(symbol).replace('/', ''))
-        return Price(Decimal(ticker['last']))
+        market_id = str(symbol).replace('/', '')
+        raw = (await self.client.fetch_ticker(market_id))['last']
+        return Price(self._last_prices.decimal(market_id, raw))
 
     async def place_order(self, symbol: Symbol, side: str, amount: Amount,
                             price: Optional[Price] = None) -> Dict:
-        params = {'timeInForce': 'GTC'} if price else {}
+        has_price = price is not None
+        order_type, params = _ORDER_TEMPLATES[has_price]
         return await self.client.create_order(
-            str(symbol).replace('/', ''), 'limit' if price else 'market', side, float(amount),
-            float(price) if price else None, params
+            str(symbol).replace('/', ''), order_type, side, float(amount),
+            float(price) if has_price else None, params.copy()
         )
 
     async def cancel_order(self, order_id: str, symbol: Symbol) -> bool:
         try:
             await self.client.cancel_order(order_id, str(symbol).replace('/', ''))
             return True
-        except:
+        except ccxt.BaseError:
             return False
 
-    def get_supported_pairs(self) -> List[Symbol]:
-        markets = self.client.load_markets()
-        return [Symbol(pair) for pair in markets if
-                'USDT' in pair or 'USDC' in pair or 'USD' in pair]  # Prioritizes USDT/USDC
\ No newline at end of file
+    async def get_order(self, order_id: str, symbol: Symbol) -> Dict[str, Any]:
+        try:
+            res = await self.client.fetch_order(order_id, str(symbol).replace('/', ''))
+        except ccxt.BaseError as e:
+            return {'id': order_id, 'status': 'unknown', 'error': str(e),
+                    'filled': _D0, 'remaining': _D0, 'avg_price': _D0}
+        return {
+            'id': res['id'],
+            'status': _binance_status(res.get('info', {}).get('status'), 'open'),
+            'filled': Decimal(str(res.get('filled') or 0)),
+            'remaining': Decimal(str(res.get('remaining') or 0)),
+            'avg_price': Decimal(str(res.get('average') or 0))
+        }
+
+    async def _refresh_markets(self) -> None:
+        if time.time() - self._markets_ts < _MARKETS_TTL:
+            return
+        markets = await self.client.load_markets(reload=True)
+        markets_hash = _payload_hash(markets)
+        if markets_hash != self._markets_hash:
+            self._market_metadata = {
+                pair: {
+                    'precision': m.get('precision', {}),
+                    'limits': m.get('limits', {}),
+                    'active': m.get('active', True)
+                } for pair, m in markets.items()
+            }
+            # Flat (amount, price) precision view for the common "precision only" callers
+            self._market_precisions = {
+                pair: (m['precision'].get('amount'), m['precision'].get('price'))
+                for pair, m in self._market_metadata.items()
+            }
+            self._supported_pairs = [Symbol(pair) for pair in markets if
+                                     pair.partition('/')[2] in _QUOTES]  # Prioritizes USDT/USDC
+            self._markets_hash = markets_hash
+        self._markets_ts = time.time()
+
+    async def get_market_metadata(self) -> Dict[str, Dict[str, Any]]:
+        await self._refresh_markets()
+        return self._market_metadata
+
+    async def get_market_precisions(self) -> Dict[str, Tuple[Any, Any]]:
+        await self._refresh_markets()
+        return self._market_precisions
+
+    async def get_asset_metadata_flat(self) -> Dict[Tuple[str, str], AssetNet]:
+        # One (asset, network) -> AssetNet lookup instead of asset -> networks -> field
+        if time.time() - self._assets_ts >= _MARKETS_TTL:
+            currencies = await self.client.fetch_currencies()
+            flat = {}
+            for code, cur in currencies.items():
+                for network, net in (cur.get('networks') or {}).items():
+                    limits = (net.get('limits') or {}).get('withdraw') or {}
+                    flat[(code, network)] = AssetNet(
+                        withdraw_fee=Decimal(str(net.get('fee') or 0)),
+                        withdraw_enabled=bool(net.get('withdraw')),
+                        deposit_enabled=bool(net.get('deposit')),
+                        min_withdraw=Decimal(str(limits.get('min') or 0))
+                    )
+            self._asset_networks = flat
+            self._assets_ts = time.time()
+        return self._asset_networks
+
+    async def fetch_fees(self, symbol: Symbol) -> Fees:
+        if time.time() - self._fees_ts >= _FEES_TTL:
+            fees = await self.client.fetch_trading_fees()
+            fees_hash = _payload_hash(fees)
+            if fees_hash != self._fees_hash:
+                self._fees = {pair: Fees(f['maker'], f['taker']) for pair, f in fees.items()}
+                self._fees_hash = fees_hash
+            self._fees_ts = time.time()
+        return self._fees.get(str(symbol), _DEFAULT_FEES)
+
+    async def get_supported_pairs(self) -> List[Symbol]:
+        await self._refresh_markets()
+        return self._supported_pairs
@@ -1,50 +1,178 @@
+import asyncio
+import time
+from datetime import datetime
+
 import ccxt.async_support as ccxt
+import numpy as np
 from decimal import Decimal
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from exchanges.base import ExchangeAdapter
-from domain.values import Price, Amount, Symbol     #<<---- NEEDS FIXING!!
+from domain.values import Price, Amount, Symbol, OrderBook     #<<---- NEEDS FIXING!!
+from adapters.exchanges._env import get_env
+from adapters.exchanges._breaker import circuit_breaker
+from adapters.exchanges._fees import TradingFeeCache
+from adapters.exchanges._levels import levels_array
+from adapters.exchanges._prices import LastPriceCache
+from adapters.exchanges._ccxt_json import OrjsonParseMixin
+from adapters.exchanges._symbols import product_id
+
+_QUOTES = frozenset({'USDT', 'USDC', 'USD'})
+_MARKETS_TTL = 3600  # Products/precisions change on the order of hours
+_FEES_TTL = 300      # Fee tier follows rolling 30d volume
+_BALANCE_TTL = 5     # Per-asset lookups within a tick share one fetch_balance
+_BOOK_CONCURRENCY = 10  # In-flight book requests; public limit is ~10 req/s per IP
+_D0 = Decimal('0')
+_DEFAULT_FEES = {'maker': Decimal('0.006'), 'taker': Decimal('0.012')}  # Advanced Trade base tier
+
+
+class _CoinbaseClient(OrjsonParseMixin, ccxt.coinbase):
+    # Book/ticker/products payloads decode with orjson when available
+    pass
+
 
 class CoinbaseRegularAdapter(ExchangeAdapter):
-    def __init__(self, config: Dict[str, Any]):
-        self.client = ccxt.coinbase({
+    name = "coinbase"
+
+    _clients: Dict[tuple, _CoinbaseClient] = {}
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            env = get_env()
+            config = {'api_key': env['COINBASE_KEY'] or '', 'api_secret': env['COINBASE_SECRET'] or ''}
+        # Adapters on the same key share one ccxt client and its keep-alive aiohttp pool
+        key = (config['api_key'], 'coinbase')
+        self.client = type(self)._clients.get(key) or type(self)._clients.setdefault(key, _CoinbaseClient({
             'apiKey': config['api_key'],
             'secret': config['api_secret'],
             'enableRateLimit': True
-        })
+        }))
+        self._balance_cache = None  # ({CURRENCY: free}, fetched_at)
+        self._book_slots = asyncio.Semaphore(_BOOK_CONCURRENCY)
+        self._order_templates: Dict[Tuple[str, str, bool], Tuple[str, str, str]] = {}
+        self._last_prices = LastPriceCache()  # Keyed by product_id
+        self.invalidate_metadata()
+
+    def invalidate_metadata(self) -> None:
+        # Manual bust, e.g. after a listing change; entries are (value, fetched_at)
+        self._markets_cache = None
+        self._pairs_cache = None
+        self._market_metadata_cache = None
+        self._asset_metadata_cache = None
+        self._fees = TradingFeeCache(_FEES_TTL, _DEFAULT_FEES)
 
     def get_name(self) -> str:
-        return "coinbase"
+        return self.name
+
+    async def _free_balances(self) -> Dict[str, Decimal]:
+        # One indexed pass per fetch; asset lookups are then plain dict gets
+        if self._balance_cache and time.time() - self._balance_cache[1] < _BALANCE_TTL:
+            return self._balance_cache[0]
+        free = (await self.client.fetch_balance()).get('free') or {}
+        balances = {cur: Decimal(str(amt)) for cur, amt in free.items() if amt}  # ccxt codes are already upper-case
+        self._balance_cache = (balances, time.time())
+        return balances
 
     async def get_balance(self, asset: str) -> Decimal:
-        balance = await self.client.fetch_balance()
-        return Decimal(balance.get(asset.upper(), {}).get('free', '0'))
+        return (await self._free_balances()).get(asset.upper(), _D0)
 
     async def get_order_book(self, symbol: Symbol, limit: int = 5) -> Dict[str, List[Dict[str, Decimal]]]:
-        book = await self.client.fetch_order_book(str(symbol).replace('/', '-'), limit)
-        return {
-            'bids': [{ 'price': Decimal(p[0]), 'amount': Decimal(p[1]) } for p in book['bids']],
-            'asks': [{ 'price': Decimal(p[0]), 'amount': Decimal(p[1]) } for p in book['asks']]
-        }
+        return (await self.get_order_book_soa(symbol, limit)).as_dicts()
+
+    async def get_order_books(self, symbols: List[Symbol], limit: int = 5) -> List[Dict[str, List[Dict[str, Decimal]]]]:
+        # Concurrent fetch on the pooled session, bounded to stay under the rate limit
+        async def _one(symbol):
+            async with self._book_slots:
+                return await self.get_order_book(symbol, limit)
+        return await asyncio.gather(*(_one(s) for s in symbols))
+
+    async def get_order_book_soa(self, symbol: Symbol, limit: int = 5) -> OrderBook:
+        # Parallel price/size tuples, no per-level dict or Decimal
+        book = await self.client.fetch_order_book(product_id(str(symbol)), limit)
+        bids, asks = book['bids'], book['asks']
+        return OrderBook(
+            tuple(p[0] for p in bids), tuple(p[1] for p in bids),
+            tuple(p[0] for p in asks), tuple(p[1] for p in asks)
+        )
+
+    async def get_order_book_np(self, symbol: Symbol, limit: int = 5) -> Dict[str, np.ndarray]:
+        # float64 book for spread/depth/imbalance math; keep get_order_book's
+        # Decimals for anything that sizes or prices an order
+        book = await self.client.fetch_order_book(product_id(str(symbol)), limit)
+        return {'bids': levels_array(book['bids'], 2), 'asks': levels_array(book['asks'], 2)}
 
     async def get_ticker_price(self, symbol: Symbol) -> Price:
-        ticker = await self.client.fetch_ticker(str(symbol).replace('/', '-'))
-        return Price(Decimal(ticker['last']))
+        pid = product_id(str(symbol))
+        raw = (await self.client.fetch_ticker(pid))['last']
+        return Price(self._last_prices.decimal(pid, raw))
 
     async def place_order(self, symbol: Symbol, side: str, amount: Amount, price: Optional[Price] = None) -> Dict:
+        has_price = bool(price)
+        key = (str(symbol), side, has_price)
+        template = self._order_templates.get(key)
+        if template is None:
+            # (product_id, order type, client_order_id prefix) fixed per (symbol, side, has_price)
+            template = self._order_templates[key] = (product_id(key[0]), 'limit' if has_price else 'market', f"{side}_{key[0]}_")
+        pid, order_type, coid_prefix = template
         # Preserve zero-fee for Coinbase One (<$500/month orders)
-        params = {'client_order_id': f"{side}_{str(symbol)}_{datetime.now().isoformat()}"}
+        params = {'client_order_id': coid_prefix + datetime.now().isoformat()}
         return await self.client.create_order(
-            str(symbol).replace('/', '-'), 'limit' if price else 'market', side, float(amount), float(price) if price else None, params
+            pid, order_type, side, float(amount), float(price) if has_price else None, params
         )
 
     async def cancel_order(self, order_id: str, symbol: Symbol) -> bool:
         try:
-            await self.client.cancel_order(order_id, str(symbol).replace('/', '-'))
+            await self.client.cancel_order(order_id, product_id(str(symbol)))
             return True
-        except:
+        except ccxt.BaseError:
             return False
 
-    def get_supported_pairs(self) -> List[Symbol]:
-        markets = self.client.load_markets()
-        return [Symbol(pair.replace('-', '/')) for pair in markets if 'USDT' in pair or 'USDC' in pair or 'USD' in pair]  # Prioritizes USDT/USDC
\ No newline at end of file
+    async def close(self) -> None:
+        await self.client.close()
+
+    async def _markets(self) -> Dict[str, Any]:
+        if self._markets_cache and time.time() - self._markets_cache[1] < _MARKETS_TTL:
+            return self._markets_cache[0]
+        markets = await self.client.load_markets(reload=True)
+        self._markets_cache = (markets, time.time())
+        return markets
+
+    @circuit_breaker(default=lambda: _DEFAULT_FEES, errors=(ccxt.BaseError,))
+    async def fetch_fees(self, symbol: Symbol) -> Dict[str, Decimal]:
+        return await self._fees.get(self.client, str(symbol))
+
+    async def get_market_metadata(self) -> Dict[str, Dict[str, Any]]:
+        if self._market_metadata_cache and time.time() - self._market_metadata_cache[1] < _MARKETS_TTL:
+            return self._market_metadata_cache[0]
+        metadata = {
+            pair: {
+                'precision': m.get('precision', {}),
+                'limits': m.get('limits', {}),
+                'active': m.get('active', True)
+            } for pair, m in (await self._markets()).items()
+        }
+        self._market_metadata_cache = (metadata, time.time())
+        return metadata
+
+    async def get_asset_metadata(self) -> Dict[str, Dict[str, Any]]:
+        if self._asset_metadata_cache and time.time() - self._asset_metadata_cache[1] < _MARKETS_TTL:
+            return self._asset_metadata_cache[0]
+        await self._markets()  # currencies are loaded alongside markets
+        metadata = {
+            code: {'precision': cur.get('precision'), 'active': cur.get('active', True)}
+            for code, cur in (self.client.currencies or {}).items()
+        }
+        self._asset_metadata_cache = (metadata, time.time())
+        return metadata
+
+    async def get_supported_pairs(self) -> List[Symbol]:
+        # Cache the built Symbols, not just the raw markets
+        if self._pairs_cache and time.time() - self._pairs_cache[1] < _MARKETS_TTL:
+            return self._pairs_cache[0]
+        # ccxt already split each product into base/quote - one field read and set test per product
+        symbols = [
+            Symbol(pair.replace('-', '/')) for pair, m in (await self._markets()).items()
+            if m.get('active', True) and m.get('quote') in _QUOTES
+        ]  # Prioritizes USDT/USDC
+        self._pairs_cache = (symbols, time.time())
+        return symbols
\ No newline at end of file
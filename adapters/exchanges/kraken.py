@@ -1,48 +1,535 @@
-import krakenex
-from decimal import Decimal
-from typing import Dict, List, Any, Optional
+import aiohttp
+import asyncio
+import base64
+import functools
+import hashlib
+import hmac
+import json
+import re
+import time
+import types
+import urllib.parse
+import numpy as np
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_EVEN
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from exchanges.base import ExchangeAdapter
-from domain.values import Price, Amount, Symbol         #<------- NEEDS FIXING!
+from domain.values import Price, Amount, Symbol, OrderBook         #<------- NEEDS FIXING!
+from adapters.exchanges._env import get_env
+from adapters.exchanges._breaker import circuit_breaker
+from adapters.exchanges._levels import levels_array
+from adapters.exchanges._prices import LastPriceCache
+from adapters.exchanges._ws_book import LocalBooks
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # Optional fast path for Depth/Ticker/AssetPairs payloads
+    _json_loads = json.loads
+
+try:
+    import ijson
+except ImportError:  # Optional - metadata refresh decodes the whole payload otherwise
+    ijson = None
+
+__all__ = ['KrakenAdapter', 'KrakenAPIError']
+
+_API_URL = 'https://api.kraken.com'
+_API_VERSION = '0'
+_WS_URL = 'wss://ws.kraken.com/v2'
+_WS_DEPTH = 25          # Levels kept per side; Kraken accepts 10/25/100/500/1000
+_WS_RECONNECT = 1.0     # Seconds between book-feed reconnect attempts
+_PAIRS_TTL = 3600  # AssetPairs/Assets change on listings only
+_FEES_TTL = 300    # Fee tier follows rolling 30d volume
+_QUOTES = frozenset({'USDT', 'USDC', 'USD'})
+_D0 = Decimal('0')
+_D100 = Decimal('100')
+_D8DP = Decimal('1e-8')  # avg_price step for pairs missing from AssetPairs
+_DEFAULT_FEES = {'maker': Decimal('0.0025'), 'taker': Decimal('0.004')}  # Kraken Pro base tier
+_BOOK_CONCURRENCY = 4  # Public endpoints allow ~1 req/s sustained with a small burst
+_TIERS = {'starter': (15, 0.33), 'intermediate': (20, 0.5), 'pro': (20, 1.0)}  # (max counter, decay/s)
+_CALL_COST = {'Ledgers': 2, 'QueryLedgers': 2, 'TradesHistory': 2, 'QueryTrades': 2,
+              'AddOrder': 0, 'CancelOrder': 0}  # Orders use the separate trading limiter
+# Standard code -> Kraken's legacy X/Z-prefixed asset code, built once at import
+_KRAKEN_SYMBOL_MAP = types.MappingProxyType({'BTC': 'XXBT', 'ETH': 'XETH', 'DOGE': 'XXDG', 'USD': 'ZUSD'})
+_KRAKEN_REVERSE_MAP = types.MappingProxyType({v: k for k, v in _KRAKEN_SYMBOL_MAP.items()})
+_ASSET_SUB = types.MappingProxyType({**_KRAKEN_REVERSE_MAP, '.': '/'})
+_ASSET_NORMALIZE = re.compile('|'.join(map(re.escape, _ASSET_SUB)))
+# QueryOrders status -> normalized order status
+_KRAKEN_STATUS_MAP = {
+    'pending': 'open',
+    'open': 'open',
+    'closed': 'closed',
+    'canceled': 'canceled',
+    'expired': 'canceled'
+}
+_kraken_status = _KRAKEN_STATUS_MAP.get
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_pair(key: str) -> str:
+    # 'XXBTZUSD' -> 'BTCUSD', 'ADA.USD' -> 'ADA/USD'; one regex pass instead of chained .replace scans
+    return _ASSET_NORMALIZE.sub(lambda m: _ASSET_SUB[m.group(0)], key)
+
+
+def _dec(value: Any) -> Decimal:
+    # Kraken sends numbers as strings - parse those directly, only stringify real floats/ints
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(value if isinstance(value, str) else str(value))
+
+
+def _dec_or_none(value: Any) -> Optional[Decimal]:
+    return _dec(value) if value is not None else None
+
+
+def _unknown_order(order_id: str, error: str) -> Dict[str, Any]:
+    return {'id': order_id, 'status': 'unknown', 'error': error,
+            'filled': _D0, 'remaining': _D0, 'avg_price': _D0, 'fee': _D0}
+
+
+class KrakenAPIError(Exception):
+    """Kraken answered with a non-empty 'error' list"""
+
+
+class _CallCounter:
+    """Client-side mirror of Kraken's per-key call counter - wait locally instead of eating a rate-limit lockout"""
+
+    def __init__(self, capacity: float, decay: float):
+        self.capacity = capacity
+        self.decay = decay
+        self.level = 0.0
+        self.updated = time.monotonic()
+
+    async def acquire(self, cost: float) -> None:
+        while True:
+            now = time.monotonic()
+            self.level = max(0.0, self.level - (now - self.updated) * self.decay)
+            self.updated = now
+            if self.level + cost <= self.capacity:
+                self.level += cost
+                return
+            await asyncio.sleep((self.level + cost - self.capacity) / self.decay)
+
+
+class _KeySlot:
+    """One API keypair with its own nonce sequence, call counter and in-flight count - one per key process-wide"""
+    __slots__ = ('key', 'secret', 'counter', 'last_nonce', 'in_flight', 'lock')
+
+    def __init__(self, key: str, secret: bytes, counter: _CallCounter):
+        self.key = key
+        self.secret = secret
+        self.counter = counter
+        self.last_nonce = 0
+        self.in_flight = 0
+        # One request on the wire per key - Kraken rejects a nonce that lands after a higher one
+        self.lock = asyncio.Lock()
+
+    def nonce(self) -> int:
+        # Strictly increasing even for calls issued in the same millisecond
+        self.last_nonce = max(int(time.time() * 1000), self.last_nonce + 1)
+        return self.last_nonce
+
+
+@functools.lru_cache(maxsize=4096)
+def _kraken_pair(symbol: str) -> str:
+    # 'BTC/USD' -> 'BTCUSD', '1INCH/USDT' -> '1INCHUSDT'; computed once per distinct symbol.
+    # Split on the separator, never on a fixed base length; 'BTCUSD' passes through as-is
+    base, _, quote = symbol.upper().partition('/')
+    return base + quote
+
 
 class KrakenAdapter(ExchangeAdapter):
-    def __init__(self, config: Dict[str, Any]):
-        self.client = krakenex.API(key=config['api_key'], secret=config['api_secret'])
+    name = "kraken"  # Plain attribute for hot dispatch; get_name() kept for callers
+
+    # Public market data is account-independent - every instance shares these (value, fetched_at) caches
+    _pairs_cache = None
+    _market_metadata_cache = None
+    _asset_metadata_cache = None
+    _pairs_set: frozenset = frozenset()  # {(base, quote)} matching _pairs_cache
+    # {altname: (price step, volume step)} from pair_decimals/lot_decimals, rebuilt with the market metadata
+    _quantizers: Dict[str, Tuple[Decimal, Decimal]] = {}
+    # {any spelling of a pair - AssetPairs key, altname, wsname, 'BTCUSDT': altname}, rebuilt with the market metadata
+    _pair_altnames: Dict[str, str] = {}
+    # One aiohttp pool to api.kraken.com for every instance; nothing in it is key-specific
+    _aio_session: Optional[aiohttp.ClientSession] = None
+    # Nonce and call counter are per API key on Kraken's side, so instances on one key share its slot
+    _slots_by_key: Dict[str, _KeySlot] = {}
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        if config is None:
+            env = get_env()
+            config = {'api_key': env['KRAKEN_KEY'] or '', 'api_secret': env['KRAKEN_SECRET'] or ''}
+        self._book_slots = asyncio.Semaphore(_BOOK_CONCURRENCY)
+        # Optional config['api_keys'] = [(key, secret), ...] on one account: private calls
+        # spread over the keys, each with its own nonce sequence and call counter - extra
+        # keys are the only source of private-call parallelism
+        tier = _TIERS[config.get('tier', 'starter')]
+        self._key_slots = [self._slot(key, secret, tier)
+                           for key, secret in (config.get('api_keys') or [(config['api_key'], config['api_secret'])])]
+        self._order_templates: Dict[Tuple[str, str, bool], Dict[str, str]] = {}
+        self._last_prices = LastPriceCache()  # Keyed by altname
+        self._fees_cache: Dict[str, Tuple[Dict[str, Decimal], float]] = {}  # Per symbol, (fees, fetched_at)
+        self._earn_strategies: Optional[Dict[str, str]] = None  # {ASSET: strategy_id}, loaded once
+        self._books = LocalBooks(_WS_DEPTH)
+
+    @staticmethod
+    def _slot(key: str, secret: str, tier: Tuple[float, float]) -> _KeySlot:
+        slot = KrakenAdapter._slots_by_key.get(key)
+        if slot is None:
+            slot = KrakenAdapter._slots_by_key[key] = _KeySlot(key, base64.b64decode(secret), _CallCounter(*tier))
+        return slot
 
     def get_name(self) -> str:
-        return "kraken"
+        return self.name
+
+    def invalidate_metadata(self) -> None:
+        # Manual bust, e.g. after a listing change; clears the shared caches for all instances
+        KrakenAdapter._pairs_cache = None
+        KrakenAdapter._pairs_set = frozenset()
+        KrakenAdapter._market_metadata_cache = None
+        KrakenAdapter._asset_metadata_cache = None
+        KrakenAdapter._quantizers = {}
+        KrakenAdapter._pair_altnames = {}
+        self._fees_cache.clear()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        # Created lazily - ClientSession must be built inside the running loop
+        session = KrakenAdapter._aio_session
+        if session is None or session.closed:
+            session = KrakenAdapter._aio_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=5, connect=2))
+        return session
+
+    @staticmethod
+    def _sign(secret: bytes, urlpath: str, data: Dict[str, Any]) -> str:
+        # API-Sign = HMAC-SHA512(urlpath + SHA256(nonce + postdata), b64decode(secret))
+        postdata = urllib.parse.urlencode(data)
+        message = urlpath.encode() + hashlib.sha256((str(data['nonce']) + postdata).encode()).digest()
+        return base64.b64encode(hmac.new(secret, message, hashlib.sha512).digest()).decode()
+
+    async def _query_public(self, method: str, data: Optional[Dict[str, Any]] = None) -> Dict:
+        session = await self._ensure_session()
+        async with session.get(f'{_API_URL}/{_API_VERSION}/public/{method}', params=data) as r:
+            return self._check(await r.json(loads=_json_loads))
+
+    async def _query_private(self, method: str, data: Optional[Dict[str, Any]] = None) -> Dict:
+        session = await self._ensure_session()
+        urlpath = f'/{_API_VERSION}/private/{method}'
+        data = {k: v for k, v in (data or {}).items() if v is not None}
+        slot = min(self._key_slots, key=lambda k: k.in_flight)  # Least-loaded keypair
+        slot.in_flight += 1
+        try:
+            await slot.counter.acquire(_CALL_COST.get(method, 1))
+            async with slot.lock:
+                # Nonce taken under the key's lock so requests reach Kraken in nonce order
+                data['nonce'] = slot.nonce()
+                headers = {'API-Key': slot.key, 'API-Sign': self._sign(slot.secret, urlpath, data)}
+                async with session.post(_API_URL + urlpath, data=data, headers=headers) as r:
+                    return self._check(await r.json(loads=_json_loads))
+        finally:
+            slot.in_flight -= 1
+
+    async def _public_result_items(self, method: str) -> AsyncIterator[Tuple[str, Any]]:
+        # Yields (key, value) from 'result' as it arrives, never holding the full multi-MB dict
+        session = await self._ensure_session()
+        async with session.get(f'{_API_URL}/{_API_VERSION}/public/{method}') as r:
+            if ijson is None:
+                for item in self._check(await r.json(loads=_json_loads))['result'].items():
+                    yield item
+                return
+            async for item in ijson.kvitems_async(r.content, 'result'):
+                yield item
+
+    @staticmethod
+    def _check(resp: Dict) -> Dict:
+        if resp.get('error'):
+            raise KrakenAPIError(', '.join(resp['error']))
+        return resp
 
     async def get_balance(self, asset: str) -> Decimal:
-        balance = self.client.query_private('Balance')
-        return Decimal(balance['result'].get(asset.upper(), '0'))
+        balances = (await self._query_private('Balance'))['result']
+        asset = asset.upper()
+        # Kraken keys legacy assets as XXBT/XETH/ZUSD
+        raw = balances.get(_KRAKEN_SYMBOL_MAP.get(asset, asset)) or balances.get(asset)
+        return _dec(raw) if raw else _D0
 
-    async def get_order_book(self, symbol: Symbol, limit: int = 5) -> Dict[str, List[Dict[str, Decimal]]]:
-        book = self.client.query_public('Depth', {'pair': str(symbol).replace('/', ''), 'count': limit})
-        pair_key = list(book['result'].keys())[0]
+    async def get_all_balances(self) -> Dict[str, Dict[str, Decimal]]:
+        raw = (await self._query_private('BalanceEx'))['result']
+        # Generator pre-pass binds each parsed Decimal once; the comprehension filters and keys in one go
+        parsed = ((asset, _dec(b['balance']), _dec(b.get('hold_trade') or _D0)) for asset, b in raw.items())
         return {
-            'bids': [{ 'price': Decimal(p[0]), 'amount': Decimal(p[1]) } for p in book['result'][pair_key]['bids']],
-            'asks': [{ 'price': Decimal(p[0]), 'amount': Decimal(p[1]) } for p in book['result'][pair_key]['asks']]
+            _KRAKEN_REVERSE_MAP.get(asset, asset): {'free': total - hold, 'total': total}
+            for asset, total, hold in parsed if total > 0
         }
 
+    async def get_order_book(self, symbol: Symbol, limit: int = 5) -> Dict[str, List[Dict[str, Decimal]]]:
+        return (await self.get_order_book_soa(symbol, limit)).as_dicts()
+
+    async def get_order_books(self, symbols: List[Symbol], limit: int = 5) -> List[Dict[str, List[Dict[str, Decimal]]]]:
+        # Concurrent fetch on the pooled session, bounded to stay under the rate limit
+        async def _one(symbol):
+            async with self._book_slots:
+                return await self.get_order_book(symbol, limit)
+        return await asyncio.gather(*(_one(s) for s in symbols))
+
+    async def _depth(self, symbol: Symbol, limit: int) -> Dict[str, List[List[Any]]]:
+        local = self._books.top(str(symbol), limit) if limit <= _WS_DEPTH else None
+        if local is not None:
+            # Pushed book is warm - same [price, qty, ts] rows as REST Depth, no round trip
+            bids, asks = local
+            return {'bids': [[p, q, 0] for p, q in bids], 'asks': [[p, q, 0] for p, q in asks]}
+        book = await self._query_public('Depth', {'pair': _kraken_pair(str(symbol)), 'count': limit})
+        return next(iter(book['result'].values()))
+
+    def start_order_book_stream(self, symbols: List[Symbol]) -> None:
+        # Book reads for these symbols are served from the v2 book feed once their snapshot lands
+        names = [str(s) for s in symbols]
+        subscribe_msg = json.dumps({'method': 'subscribe', 'params': {'channel': 'book', 'symbol': names, 'depth': _WS_DEPTH}})
+        self._books.start(_WS_URL, subscribe_msg, names, self._on_book_message, _WS_RECONNECT)
+
+    def _on_book_message(self, message: str) -> None:
+        # v2 sends prices as JSON numbers - keep their literal text for exact Decimals
+        msg = json.loads(message, parse_float=str, parse_int=str)
+        if msg.get('channel') != 'book':
+            return  # status / heartbeat / subscribe acks
+        snapshot = msg.get('type') == 'snapshot'
+        for entry in msg.get('data', ()):
+            self._books.apply(entry['symbol'],
+                              [(level['price'], level['qty']) for level in entry.get('bids', ())],
+                              [(level['price'], level['qty']) for level in entry.get('asks', ())],
+                              snapshot=snapshot)
+
+    async def get_order_book_soa(self, symbol: Symbol, limit: int = 5) -> OrderBook:
+        # Kraken levels are [price, volume, ts] strings - keep them as-is in parallel tuples
+        levels = await self._depth(symbol, limit)
+        bids, asks = levels['bids'], levels['asks']
+        return OrderBook(
+            tuple(p[0] for p in bids), tuple(p[1] for p in bids),
+            tuple(p[0] for p in asks), tuple(p[1] for p in asks)
+        )
+
+    async def get_order_book_np(self, symbol: Symbol, limit: int = 5) -> Dict[str, np.ndarray]:
+        # float64 book for spread/depth/imbalance math; keep get_order_book's
+        # Decimals for anything that sizes or prices an order
+        levels = await self._depth(symbol, limit)
+        # Kraken levels are [price, volume, ts]
+        return {'bids': levels_array(levels['bids'], 3), 'asks': levels_array(levels['asks'], 3)}
+
     async def get_ticker_price(self, symbol: Symbol) -> Price:
-        ticker = self.client.query_public('Ticker', {'pair': str(symbol).replace('/', '')})
-        pair_key = list(ticker['result'].keys())[0]
-        return Price(Decimal(ticker['result'][pair_key]['c'][0]))
+        return (await self.get_ticker_prices([symbol]))[symbol]
+
+    async def _altnames(self) -> Dict[str, str]:
+        # Empty when AssetPairs is unreachable - callers fall back to _kraken_pair/_normalize_pair names
+        try:
+            await self.get_market_metadata()  # Cache hit outside the hourly refresh
+        except (aiohttp.ClientError, asyncio.TimeoutError, KrakenAPIError):
+            pass
+        return self._pair_altnames
+
+    async def get_ticker_prices(self, symbols: List[Symbol]) -> Dict[Symbol, Price]:
+        # Ticker takes a comma-separated pair list - one request for every symbol, sent as altnames
+        altnames = await self._altnames()
+        by_pair = {}
+        for s in symbols:
+            pair = _kraken_pair(str(s))
+            by_pair[altnames.get(pair, pair)] = s
+        ticker = await self._query_public('Ticker', {'pair': ','.join(by_pair)})
+        prices = {}
+        for key, info in ticker['result'].items():
+            # Response keys are Kraken's canonical names (XXBTZUSD, XBTUSDT) - map back through AssetPairs
+            pair = altnames.get(key) or _normalize_pair(key).replace('/', '')
+            if pair not in by_pair:
+                if len(by_pair) != 1:
+                    continue
+                pair = next(iter(by_pair))  # Single request (e.g. XBTUSD alias) - the one result is ours
+            prices[by_pair[pair]] = Price(self._last_prices.decimal(pair, info['c'][0]))
+        if len(prices) < len(by_pair):
+            # Kraken fails the whole request on an unknown pair - a silently absent one is an error too
+            missing = ', '.join(str(s) for s in by_pair.values() if s not in prices)
+            raise KrakenAPIError(f'No ticker for {missing}')
+        return prices
 
     async def place_order(self, symbol: Symbol, side: str, amount: Amount, price: Optional[Price] = None) -> Dict:
-        order_type = 'limit' if price else 'market'
-        resp = self.client.query_private('AddOrder', {
-            'pair': str(symbol).replace('/', ''),
-            'type': side,
-            'ordertype': order_type,
-            'volume': str(amount),
-            'price': str(price) if price else None
-        })
+        has_price = bool(price)
+        key = (str(symbol), side, has_price)
+        template = self._order_templates.get(key)
+        if template is None:
+            # Static fields per (symbol, side, has_price); only volume/price vary per order
+            template = self._order_templates[key] = {
+                'pair': _kraken_pair(key[0]),
+                'type': side,
+                'ordertype': 'limit' if has_price else 'market'
+            }
+        price_q, volume_q = await self._quantizer(template['pair'])
+        # Round to the pair's decimals here so Kraken never rejects on precision
+        volume = _dec(amount)
+        if volume_q is not None:
+            volume = volume.quantize(volume_q, rounding=ROUND_DOWN)  # Never size above what was asked
+        data = dict(template, volume=str(volume))
+        if has_price:
+            limit = _dec(price)
+            data['price'] = str(limit.quantize(price_q, rounding=ROUND_HALF_EVEN) if price_q is not None else limit)
+        resp = await self._query_private('AddOrder', data)
         return {'id': resp['result']['txid'][0] if 'txid' in resp['result'] else None}
 
     async def cancel_order(self, order_id: str, symbol: Symbol) -> bool:
-        resp = self.client.query_private('CancelOrder', {'txid': order_id})
+        try:
+            resp = await self._query_private('CancelOrder', {'txid': order_id})
+        except (aiohttp.ClientError, asyncio.TimeoutError, KrakenAPIError):
+            return False
         return 'result' in resp and resp['result'].get('count', 0) > 0
 
-    def get_supported_pairs(self) -> List[Symbol]:
-        pairs = self.client.query_public('AssetPairs')['result']
-        return [Symbol(key.replace('XXBT', 'BTC').replace('XETH', 'ETH').replace('ZUSD', 'USD').replace('.', '/')) for key in pairs.keys()]  # Includes USDT/USDC if supported
\ No newline at end of file
+    async def _quantizer(self, pair: str) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        # (None, None) - send unquantized - for unknown pairs or while AssetPairs is unreachable
+        altnames = await self._altnames()
+        return self._quantizers.get(altnames.get(pair, pair), (None, None))
+
+    async def get_order(self, order_id: str, symbol: Symbol) -> Dict[str, Any]:
+        try:
+            price_q = (await self._quantizer(_kraken_pair(str(symbol))))[0] or _D8DP
+            res = (await self._query_private('QueryOrders', {'txid': order_id}))['result']
+        except (aiohttp.ClientError, asyncio.TimeoutError, KrakenAPIError) as e:
+            return _unknown_order(order_id, str(e))
+        order = res.get(order_id)
+        if order is None:
+            return _unknown_order(order_id, 'order not found')
+        filled = _dec(order.get('vol_exec') or '0')
+        cost = _dec(order.get('cost') or '0')
+        return {
+            'id': order_id,
+            'status': _kraken_status(order.get('status'), 'open'),
+            'filled': filled,
+            'remaining': _dec(order.get('vol') or '0') - filled,
+            'avg_price': (cost / filled).quantize(price_q, rounding=ROUND_HALF_EVEN) if filled else _D0,
+            'fee': _dec(order.get('fee') or '0')
+        }
+
+    async def _earn_strategy(self, asset: str) -> Optional[str]:
+        # Strategy ids are fetched once and reused by every stake/unstake
+        if self._earn_strategies is None:
+            items = (await self._query_private('Earn/Strategies'))['result'].get('items', [])
+            strategies = {}
+            for item in items:
+                # Prefer flexible (no lock-up) strategies when an asset has several
+                if item['asset'] not in strategies or item.get('lock_type', {}).get('type') == 'flex':
+                    strategies[item['asset']] = item['id']
+            self._earn_strategies = strategies
+        asset = asset.upper()
+        return self._earn_strategies.get(_KRAKEN_SYMBOL_MAP.get(asset, asset)) or self._earn_strategies.get(asset)
+
+    async def stake(self, asset: str, amount: str) -> bool:
+        strategy_id = await self._earn_strategy(asset)
+        if strategy_id is None:
+            return False
+        resp = await self._query_private('Earn/Allocate', {'strategy_id': strategy_id, 'amount': str(amount)})
+        return bool(resp.get('result'))
+
+    async def unstake(self, asset: str, amount: str) -> bool:
+        strategy_id = await self._earn_strategy(asset)
+        if strategy_id is None:
+            return False
+        resp = await self._query_private('Earn/Deallocate', {'strategy_id': strategy_id, 'amount': str(amount)})
+        return bool(resp.get('result'))
+
+    async def close(self) -> None:
+        self._books.stop()
+        # Shared pool - closing it ends it for every instance (shutdown path)
+        if KrakenAdapter._aio_session is not None:
+            await KrakenAdapter._aio_session.close()
+            KrakenAdapter._aio_session = None
+
+    @circuit_breaker(default=lambda: _DEFAULT_FEES, errors=(aiohttp.ClientError, asyncio.TimeoutError, KrakenAPIError))
+    async def fetch_fees(self, symbol: Symbol) -> Dict[str, Decimal]:
+        key = str(symbol)
+        cached = self._fees_cache.get(key)
+        if cached and time.time() - cached[1] < _FEES_TTL:
+            return cached[0]
+        res = await self._query_private('TradeVolume', {'pair': _kraken_pair(key), 'fee-info': 'true'})
+        fee = next(iter(res['result'].get('fees', {}).values()), {})
+        maker = next(iter(res['result'].get('fees_maker', {}).values()), fee)
+        # Kraken reports percentages
+        if 'fee' not in fee:
+            return _DEFAULT_FEES
+        fees = {'maker': _dec(maker.get('fee', fee['fee'])) / _D100, 'taker': _dec(fee['fee']) / _D100}
+        self._fees_cache[key] = (fees, time.time())
+        return fees
+
+    async def get_market_metadata(self) -> Dict[str, Dict[str, Any]]:
+        if self._market_metadata_cache and time.time() - self._market_metadata_cache[1] < _PAIRS_TTL:
+            return self._market_metadata_cache[0]
+        metadata = {
+            key: {
+                'base': _KRAKEN_REVERSE_MAP.get(p.get('base'), p.get('base')),
+                'quote': _KRAKEN_REVERSE_MAP.get(p.get('quote'), p.get('quote')),
+                'altname': p.get('altname', key),
+                'wsname': p.get('wsname'),
+                'precision': {'price': p.get('pair_decimals'), 'amount': p.get('lot_decimals')},
+                # Parsed once per refresh; cached entries are reused as-is
+                'limits': {'amount': {'min': _dec_or_none(p.get('ordermin'))}, 'cost': {'min': _dec_or_none(p.get('costmin'))}},
+                'active': p.get('status', 'online') == 'online'
+            } async for key, p in self._public_result_items('AssetPairs')
+        }
+        if not metadata:  # Streamed error responses carry no 'result' - don't cache that
+            return metadata
+        altnames = {}
+        for key, m in metadata.items():
+            alt = altnames[key] = m['altname']
+            altnames[alt] = alt
+            if m['wsname']:  # Dark-pool '.d' pairs have none and share base/quote with the lit pair
+                altnames.setdefault(m['wsname'].replace('/', ''), alt)
+                altnames.setdefault(m['base'] + m['quote'], alt)  # _kraken_pair form, e.g. 'BTCUSDT'
+        quantizers = {}
+        for key, m in metadata.items():
+            price_dp, amount_dp = m['precision']['price'], m['precision']['amount']
+            if price_dp is None or amount_dp is None:
+                continue
+            # Keyed by altname; _quantizer resolves order pairs ('BTCUSDT') through _pair_altnames
+            quantizers[m['altname']] = (Decimal(1).scaleb(-price_dp), Decimal(1).scaleb(-amount_dp))
+        KrakenAdapter._quantizers = quantizers
+        KrakenAdapter._pair_altnames = altnames
+        KrakenAdapter._market_metadata_cache = (metadata, time.time())
+        return metadata
+
+    async def get_asset_metadata(self) -> Dict[str, Dict[str, Any]]:
+        if self._asset_metadata_cache and time.time() - self._asset_metadata_cache[1] < _PAIRS_TTL:
+            return self._asset_metadata_cache[0]
+        metadata = {}
+        async for key, a in self._public_result_items('Assets'):
+            status = a.get('status') or 'enabled'  # Bound once per asset
+            # Legacy codes (XXBT) map to the standard name the rest of the adapter uses, not altname 'XBT'
+            metadata[_KRAKEN_REVERSE_MAP.get(key) or a.get('altname', key)] = {
+                'precision': a.get('decimals'),
+                'active': status == 'enabled',
+                'deposit_enabled': status in ('enabled', 'deposit_only'),
+                'withdraw_enabled': status in ('enabled', 'withdrawal_only')
+            }
+        if not metadata:
+            return metadata
+        KrakenAdapter._asset_metadata_cache = (metadata, time.time())
+        return metadata
+
+    async def refresh_metadata(self) -> None:
+        # Drop and eagerly rebuild the shared metadata caches
+        self.invalidate_metadata()
+        await asyncio.gather(self.get_market_metadata(), self.get_asset_metadata())
+
+    async def get_supported_pairs(self) -> List[Symbol]:
+        # Cache the built Symbols, not just the raw AssetPairs payload
+        if self._pairs_cache and time.time() - self._pairs_cache[1] < _PAIRS_TTL:
+            return self._pairs_cache[0]
+        # Keys come from the (cached, streamed) market metadata rather than a second AssetPairs request
+        pairs = await self.get_market_metadata()
+        if not pairs:
+            return []
+        # Exact quote set test on the parsed quote; prioritizes USDT/USDC
+        live = [(key, m) for key, m in pairs.items() if m['active'] and m['quote'] in _QUOTES]
+        symbols = [Symbol(_normalize_pair(key)) for key, _ in live]
+        KrakenAdapter._pairs_set = frozenset((m['base'], m['quote']) for _, m in live)
+        KrakenAdapter._pairs_cache = (symbols, time.time())
+        return symbols
+
+    async def supported_pairs_set(self) -> frozenset:
+        # {(base, quote)} for O(1) membership checks, refreshed with get_supported_pairs
+        await self.get_supported_pairs()
+        return self._pairs_set
\ No newline at end of file
@@ -1,45 +1,159 @@
+import functools
+import threading
+import time
+import types
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
 from utils.utils import log
 
+_TICKER_TIMEOUT = 5  # Seconds to wait on any one exchange's ticker
+_TICKER_TTL = 0.5    # Repeat best_buy calls within this window reuse the last ticker
+_VENUES_TTL = 3600   # Which exchanges list a pair changes on listings only
+# Shared across calls - ccxt's sync HTTP releases the GIL while waiting on the network
+_TICKER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='abot-ticker')
+
+Position = namedtuple('Position', 'amount exchange staked')
+
+
+@functools.lru_cache(maxsize=4096)
+def _pair(base, quote='USDT'):
+    # 'ETH' -> 'ETH/USDT', built once per distinct coin
+    return f"{base}/{quote}"
+
+
 class ABot:
     def __init__(self, config, staking_manager, transfer_manager):
         self.config = config
+        # ccxt's default requests pool keeps 10 connections per host - ticker and liquidation
+        # threads fan out wider than that, so give each exchange session a bigger keep-alive pool
+        for ex in config['exchanges'].values():
+            session = getattr(ex, 'session', None)
+            if session is not None:
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
         self.staking = staking_manager
         self.transfer = transfer_manager
-        self.positions = {}  # coin: {'amount':, 'exchange':, 'staked':}
+        # Positions as parallel per-field dicts keyed by coin (same key order in each)
+        self.amounts = {}
+        self.venues = {}  # coin -> exchange id
+        self.staked = {}
+        self._positions_view = None  # Read-only legacy view, rebuilt only after a position changes
+        self._cache = {}  # (exchange id | 'venues', pair): (expires_at, value), time.monotonic() based
+        self._allowed = frozenset(config['a_bot_coins'])  # O(1) membership for every signal
+        self._slot_size = None  # (pool, pool / 6) - recomputed only when the pool changes
+        self._positions_lock = threading.Lock()  # Parallel liquidation closes positions concurrently
+
+    def _cached(self, key, ttl, loader):
+        hit = self._cache.get(key)
+        if hit and time.monotonic() < hit[0]:
+            return hit[1]
+        value = loader()
+        self._cache[key] = (time.monotonic() + ttl, value)
+        return value
+
+    def slot_size(self, pool):
+        if self._slot_size is None or self._slot_size[0] != pool:
+            self._slot_size = (pool, pool / 6)
+        return self._slot_size[1]
+
+    @property
+    def positions(self):
+        # Legacy coin -> {'amount', 'exchange', 'staked'} view; status polls reuse it until a buy/sell
+        view = self._positions_view
+        if view is None:
+            view = self._positions_view = types.MappingProxyType({
+                coin: types.MappingProxyType({'amount': amount, 'exchange': self.venues[coin], 'staked': self.staked[coin]})
+                for coin, amount in self.amounts.items()
+            })
+        return view
+
+    def _open_position(self, coin, amount, exchange, staked):
+        self.amounts[coin] = amount
+        self.venues[coin] = exchange
+        self.staked[coin] = staked
+        self._positions_view = None
+
+    def _close_position(self, coin):
+        self._positions_view = None
+        return Position(self.amounts.pop(coin), self.venues.pop(coin), self.staked.pop(coin))
 
     def manage_positions(self, pool):
-        empty_slots = 6 - len(self.positions)
+        empty_slots = 6 - len(self.amounts)
         if empty_slots > 0:
-            self.fill_empty(empty_slots, pool / 6)
+            self.fill_empty(empty_slots, self.slot_size(pool))
 
     def handle_signal(self, action, coin):
-        if action == 'buy' and len(self.positions) < 6 and coin in self.config['a_bot_coins']:
+        if action == 'buy' and len(self.amounts) < 6 and coin in self._allowed:
+            if self._slot_size is None:
+                log(f"Skipped buy {coin}: pool not sized yet")
+                return
             ex, price = self.best_buy(coin)
-            amount = (pool / 6) / price  # Adjust to pool slot
-            ex.create_market_buy_order(f"{coin}/USDT", amount)
-            self.positions[coin] = {'amount': amount, 'exchange': ex.id, 'staked': self.staking.stake_coin(ex, coin, amount)}
+            amount = self._slot_size[1] / price  # Adjust to pool slot
+            ex.create_market_buy_order(_pair(coin), amount)
+            self._open_position(coin, amount, ex.id, self.staking.stake_coin(ex, coin, amount))
             log(f"Bought {amount} {coin} on {ex.id}")
-        elif action == 'sell' and coin in self.positions:
-            pos = self.positions.pop(coin)
-            self.staking.unstake(self.config['exchanges'][pos['exchange']], coin, pos['amount'])  # FIFO oldest
-            ex = self.config['exchanges'][pos['exchange']]
-            ex.create_market_sell_order(f"{coin}/USDT", pos['amount'])
-            log(f"Sold {pos['amount']} {coin} on {ex.id}")
+        elif action == 'sell':
+            with self._positions_lock:
+                if coin not in self.amounts:
+                    return
+                pos = self._close_position(coin)
+            ex = self.config['exchanges'][pos.exchange]
+            self.staking.unstake(ex, coin, pos.amount)  # FIFO oldest
+            ex.create_market_sell_order(_pair(coin), pos.amount)
+            log(f"Sold {pos.amount} {coin} on {ex.id}")
 
     def fill_empty(self, slots, amount_per):
-        for _ in range(slots):
-            coin = self.config['default_stake_coin']
-            ex, price = self.best_buy(coin)
-            amount = amount_per / price
-            ex.create_market_buy_order(f"{coin}/USDT", amount)
-            self.positions[coin] = {'amount': amount, 'exchange': ex.id, 'staked': self.staking.stake_coin(ex, coin, amount)}
-            log(f"Filled empty with {amount} {coin}")
+        filled = []
+        try:
+            for _ in range(slots):
+                coin = self.config['default_stake_coin']
+                ex, price = self.best_buy(coin)
+                amount = amount_per / price
+                ex.create_market_buy_order(_pair(coin), amount)
+                self._open_position(coin, amount, ex.id, self.staking.stake_coin(ex, coin, amount))
+                filled.append(f"Filled empty with {amount} {coin}")
+        finally:
+            if filled:  # One log write for the sweep; buys made before a failure are still recorded
+                log(*filled)
 
     def best_buy(self, coin):
-        prices = {ex: ex.fetch_ticker(f"{coin}/USDT")['ask'] for ex in self.config['exchanges'].values() if f"{coin}/USDT" in ex.markets}
-        best_ex = min(prices, key=prices.get)
-        return best_ex, prices[best_ex]
+        pair = _pair(coin)
+        # pair -> exchanges listing it, indexed once instead of probing every exchange per call
+        venues = self._cached(('venues', pair), _VENUES_TTL,
+                              lambda: tuple(ex for ex in self.config['exchanges'].values() if pair in ex.markets))
+        # All tickers in flight at once - latency is the slowest exchange, not the sum
+        futures = [(ex, _TICKER_POOL.submit(self._cached, (ex.id, pair), _TICKER_TTL,
+                                            lambda ex=ex: ex.fetch_ticker(pair)))
+                   for ex in venues]
+        # Reduce to the lowest ask as results arrive - no intermediate prices dict
+        best_ex, best_ask = None, None
+        for ex, future in futures:
+            try:
+                ask = future.result(timeout=_TICKER_TIMEOUT)['ask']
+            except Exception as e:  # One slow/failing exchange shouldn't block the buy
+                log(f"Ticker {pair} failed on {ex.id}: {e}")
+                continue
+            if ask and (best_ask is None or ask < best_ask):
+                best_ex, best_ask = ex, ask
+        if best_ex is None:
+            raise ValueError(f"No ask for {pair} on any exchange")
+        return best_ex, best_ask
 
     def liquidate(self):
-        for coin in list(self.positions):
+        by_venue = {}
+        for coin, venue in list(self.venues.items()):
+            by_venue.setdefault(venue, []).append(coin)
+        if not by_venue:
+            return
+        # One thread per exchange, selling its coins in order - a sync ccxt client (and Kraken's
+        # nonce) isn't safe to share across threads, so only different exchanges overlap
+        with ThreadPoolExecutor(max_workers=len(by_venue), thread_name_prefix='abot-liquidate') as pool:
+            list(pool.map(self._sell_all, by_venue.values()))
+
+    def _sell_all(self, coins):
+        for coin in coins:
             self.handle_signal('sell', coin)
\ No newline at end of file
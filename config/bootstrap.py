@@ -0,0 +1,20 @@
+"""
+Environment bootstrap - loads .env files once per process
+"""
+import os
+
+from dotenv import find_dotenv, load_dotenv
+
+_CONFIG_ENV = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+_LOADED = False
+
+
+def load_env() -> None:
+    """Load config/.env, then the nearest .env at or above the cwd, on first call only"""
+    global _LOADED
+    if _LOADED:
+        return
+    load_dotenv(_CONFIG_ENV)
+    # Bare load_dotenv() searches from this file, not the cwd; never overrides values set above
+    load_dotenv(find_dotenv(usecwd=True))
+    _LOADED = True
@@ -519,11 +519,18 @@ class HealthMonitor:
 
     def record_heartbeat(self, exchange_name: str, response_time_ms: int):
         """Record heartbeat from exchange without blocking"""
-        self.exchange_health[exchange_name] = ExchangeHealth(
-            exchange_name=exchange_name,
-            last_heartbeat=datetime.utcnow(),
-            api_response_time_ms=response_time_ms
-        )
+        health = self.exchange_health.get(exchange_name)
+        if health is None:
+            self.exchange_health[exchange_name] = ExchangeHealth(
+                exchange_name=exchange_name,
+                last_heartbeat=datetime.utcnow(),
+                api_response_time_ms=response_time_ms
+            )
+            return
+        health.beat(response_time_ms)
+        # A heartbeat clears the error tally, as replacing the record used to
+        health.errors_last_hour = 0
+        health.is_healthy = True
 
     def record_error(self, exchange_name: str, error: str):
         """Track errors for circuit breaking"""
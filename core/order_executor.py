@@ -8,6 +8,7 @@ Author: |\/|||
 """
 
 import logging
+import random
 import time
 from typing import Dict, List, Optional
 from decimal import Decimal, ROUND_DOWN
@@ -65,7 +66,7 @@ class OrderExecutor:
             bool: True if execution was successful
         """
         start_time = time.time()
-        self.logger.info(f"🚀 Executing arbitrage trade: {symbol}")
+        self.logger.info("🚀 Executing arbitrage trade: %s", symbol)
 
         # Extract trade parameters
         if trade_params is None:
@@ -101,7 +102,7 @@ class OrderExecutor:
         min_sell_price = sell_price * (
                     Decimal('1') - Decimal(str(self.settings['max_slippage_percent'])) / Decimal('100'))
         # Execute buy order
-        self.logger.info(f"🛒 Buying {asset_amount:.6f} {base_currency} on {buy_exchange}")
+        self.logger.info("🛒 Buying %.6f %s on %s", asset_amount, base_currency, buy_exchange)
         buy_result = self._execute_order(
             exchange_id=buy_exchange,
             symbol=symbol,
@@ -121,7 +122,7 @@ class OrderExecutor:
         buy_fee = buy_result.get('fee', Decimal('0'))
 
         # Execute sell order
-        self.logger.info(f"💰 Selling {actual_buy_amount:.6f} {base_currency} on {sell_exchange}")
+        self.logger.info("💰 Selling %.6f %s on %s", actual_buy_amount, base_currency, sell_exchange)
         sell_result = self._execute_order(
             exchange_id=sell_exchange,
             symbol=symbol,
@@ -306,7 +307,7 @@ class OrderExecutor:
         hedge_exchange = alternative_exchanges[0]
 
         # Execute hedge (sell at market to minimize further loss)
-        self.logger.info(f"🛡️  Hedging on {hedge_exchange} at market price")
+        self.logger.info("🛡️  Hedging on %s at market price", hedge_exchange)
         hedge_result = self._execute_order(
             exchange_id=hedge_exchange,
             symbol=symbol,
@@ -336,8 +337,8 @@ class OrderExecutor:
         """
         for attempt in range(self.settings['max_retries']):
             try:
-                self.logger.debug(f"   Attempt {attempt + 1}/{self.settings['max_retries']}: "
-                                  f"{side.upper()} {amount} {symbol} on {exchange_id}")
+                self.logger.debug("   Attempt %d/%d: %s %s %s on %s", attempt + 1, self.settings['max_retries'],
+                                  side.upper(), amount, symbol, exchange_id)
 
                 # Get exchange wrapper (in real implementation, this would be injected)
                 # For now, simulate execution
@@ -353,7 +354,6 @@ class OrderExecutor:
                 fee = amount * execution_price * fee_rate
 
                 # Simulate random failure (remove in production)
-                import random
                 if random.random() < 0.05:  # 5% failure rate for simulation
                     raise Exception("Simulated exchange error")
 
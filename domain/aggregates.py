@@ -1,15 +1,53 @@
 """
 Aggregate roots - maintain consistency boundaries
 """
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional
 from datetime import datetime, timedelta
 
-from domain.entities import Symbol, Balance, Order, TradingMode, MacroSignal
+import numpy as np
 
+from domain.entities import Symbol, Balance, Order, TradingMode, MacroSignal
 
-@dataclass
+_SHARPE_STEP = Decimal('0.000001')  # Ratio precision reported by get_sharpe_ratio
+_MACRO_COOLDOWN = 86400.0  # 24 hour cooldown between macro switches, in seconds
+_PNL_WINDOW = 1000  # Most recent trades kept for the Sharpe ratio
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True)
+def _sharpe(returns):
+    """Mean / population stddev of a float64 array in one Welford pass; 0.0 when flat"""
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(returns.shape[0]):
+        n += 1
+        d = returns[i] - mean
+        mean += d / n
+        m2 += d * (returns[i] - mean)
+    var = m2 / n
+    if var <= 0.0:
+        return 0.0
+    return mean / var ** 0.5
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Decimal from a checkpoint value - only floats need the str() detour for an exact parse"""
+    return Decimal(str(value)) if isinstance(value, float) else Decimal(value)
+
+
+@dataclass(slots=True)
 class Portfolio:
     """Root aggregate for entire portfolio state"""
     exchange_balances: Dict[str, Dict[str, Balance]] = field(default_factory=dict)
@@ -18,12 +56,15 @@ class Portfolio:
     total_profit_usd: Decimal = Decimal('0')
     total_trades: int = 0
     winning_trades: int = 0
+    # Per-trade profit, in record order; only the last _PNL_WINDOW trades are kept
+    pnl_history: Deque[Decimal] = field(default_factory=lambda: deque(maxlen=_PNL_WINDOW))
 
     # Macro cycle state - CRITICAL: Only changes 1-2x/year
     macro_signal: Optional[MacroSignal] = None
     gold_accumulated_this_cycle: Decimal = Decimal('0')
     gold_target_this_cycle: Decimal = Decimal('0')
     last_macro_switch: Optional[datetime] = None
+    last_macro_switch_mono: Optional[float] = None  # time.monotonic() twin of last_macro_switch
 
     def update_macro_signal(self, signal: MacroSignal) -> bool:
         """Update macro mode with cooldown protection"""
@@ -32,6 +73,7 @@ class Portfolio:
 
         self.macro_signal = signal
         self.last_macro_switch = datetime.utcnow()
+        self.last_macro_switch_mono = time.monotonic()
 
         # Recalculate gold target when macro switches
         if signal.mode == TradingMode.GOLD_MODE:
@@ -43,16 +85,21 @@ class Portfolio:
         return True
 
     def _can_switch_macro(self) -> bool:
+        # Fast path: one float subtract, no datetime construction
+        if self.last_macro_switch_mono is not None:
+            return time.monotonic() - self.last_macro_switch_mono > _MACRO_COOLDOWN
         if not self.last_macro_switch:
             return True
 
-        cooldown = timedelta(hours=24)  # 24 hour cooldown
+        # Only a wall-clock stamp (e.g. restored state) - compare datetimes
+        cooldown = timedelta(seconds=_MACRO_COOLDOWN)
         return datetime.utcnow() - self.last_macro_switch > cooldown
 
     def record_arbitrage_profit(self, profit_usd: Decimal):
         """Record profit and update winning trade stats"""
         self.total_profit_usd += profit_usd
         self.total_trades += 1
+        self.pnl_history.append(profit_usd)
 
         if profit_usd > 0:
             self.winning_trades += 1
@@ -60,11 +107,40 @@ class Portfolio:
     def get_win_rate(self) -> Decimal:
         if self.total_trades == 0:
             return Decimal('0')
-        return Decimal(str(self.winning_trades / self.total_trades))
+        return Decimal(self.winning_trades) / Decimal(self.total_trades)  # Exact, no float round-trip
 
     def get_sharpe_ratio(self) -> Decimal:
-        # Placeholder - would need P&L history
-        return Decimal('1.5')  # Assume good performance
+        """Per-trade Sharpe ratio (mean / stddev of pnl_history, no annualization)"""
+        pnl_history = self.pnl_history
+        if len(pnl_history) < 2:
+            return Decimal('0')
+        ratio = _sharpe(np.fromiter((float(p) for p in pnl_history), dtype=np.float64, count=len(pnl_history)))
+        return Decimal.from_float(ratio).quantize(_SHARPE_STEP)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Checkpoint of the portfolio counters and P&L window; Decimals as strings, datetimes as ISO 8601"""
+        return {
+            'total_profit_usd': str(self.total_profit_usd),
+            'total_trades': self.total_trades,
+            'winning_trades': self.winning_trades,
+            'gold_accumulated_this_cycle': str(self.gold_accumulated_this_cycle),
+            'gold_target_this_cycle': str(self.gold_target_this_cycle),
+            'pnl_history': [str(p) for p in self.pnl_history],
+            'last_macro_switch': self.last_macro_switch.isoformat() if self.last_macro_switch else None
+        }
+
+    def restore_from_dict(self, data: Dict[str, Any]) -> None:
+        """Rehydrate the state written by to_dict"""
+        self.total_profit_usd = _to_decimal(data.get('total_profit_usd', 0))
+        self.total_trades = int(data.get('total_trades', 0))
+        self.winning_trades = int(data.get('winning_trades', 0))
+        self.gold_accumulated_this_cycle = _to_decimal(data.get('gold_accumulated_this_cycle', 0))
+        self.gold_target_this_cycle = _to_decimal(data.get('gold_target_this_cycle', 0))
+        self.pnl_history = deque(map(_to_decimal, data.get('pnl_history', ())), maxlen=_PNL_WINDOW)
+        # fromisoformat takes either 'T' or ' ' as the separator on 3.11+ - no normalizing pass
+        last_switch = data.get('last_macro_switch')
+        self.last_macro_switch = datetime.fromisoformat(last_switch) if last_switch else None
+        self.last_macro_switch_mono = None  # Cooldown falls back to the restored wall-clock stamp
 
     def should_convert_to_gold(self) -> bool:
         """CRITICAL: Only true at end of MACRO cycle (1-2x/year)"""
@@ -73,7 +149,7 @@ class Portfolio:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExchangeHealth:
     """Health status for each exchange"""
     exchange_name: str
@@ -81,8 +157,22 @@ class ExchangeHealth:
     errors_last_hour: int = 0
     is_healthy: bool = True
     api_response_time_ms: int = 0
+    last_heartbeat_mono: Optional[float] = None  # time.monotonic() twin of last_heartbeat
+
+    def __post_init__(self):
+        if self.last_heartbeat_mono is None:
+            # Anchor to last_heartbeat's real age - total_seconds(), since timedelta.seconds
+            # drops whole days and would make a day-old heartbeat look seconds old
+            age = (datetime.utcnow() - self.last_heartbeat).total_seconds()
+            self.last_heartbeat_mono = time.monotonic() - max(age, 0.0)
+
+    def beat(self, response_time_ms: Optional[int] = None) -> None:
+        """Stamp a heartbeat now - the only writer of last_heartbeat, so both clocks move together"""
+        self.last_heartbeat = datetime.utcnow()
+        self.last_heartbeat_mono = time.monotonic()
+        if response_time_ms is not None:
+            self.api_response_time_ms = response_time_ms
 
     def is_alive(self, timeout_seconds: int = 60) -> bool:
         """Check if exchange is responding"""
-        age = datetime.utcnow() - self.last_heartbeat
-        return age.seconds < timeout_seconds and self.is_healthy
+        return time.monotonic() - self.last_heartbeat_mono < timeout_seconds and self.is_healthy
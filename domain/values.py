@@ -3,7 +3,7 @@ Value objects - immutable, validated values
 """
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 
 @dataclass(frozen=True)
@@ -37,6 +37,22 @@ class FeeStructure:
         return base_fee
 
 
+@dataclass(frozen=True)
+class OrderBook:
+    """Struct-of-arrays book: parallel price/size tuples holding the raw exchange values"""
+    bids_px: Tuple
+    bids_sz: Tuple
+    asks_px: Tuple
+    asks_sz: Tuple
+
+    def as_dicts(self) -> Dict[str, List[Dict[str, Decimal]]]:
+        """Legacy [{'price', 'amount'}] view - Decimals are built only here"""
+        return {
+            'bids': [{'price': Decimal(str(p)), 'amount': Decimal(str(a))} for p, a in zip(self.bids_px, self.bids_sz)],
+            'asks': [{'price': Decimal(str(p)), 'amount': Decimal(str(a))} for p, a in zip(self.asks_px, self.asks_sz)]
+        }
+
+
 @dataclass(frozen=True)
 class OrderConstraints:
     min_order_size_usd: Decimal
@@ -9,6 +9,7 @@ Author: |\/|||
 
 
 import asyncio
+import inspect
 import json
 import logging
 import os
@@ -20,9 +21,9 @@ from decimal import Decimal
 from datetime import datetime
 from typing import Dict, Any
 from concurrent.futures import ThreadPoolExecutor   # <----What is this?? Spot only! no futures!
-from dotenv import load_dotenv  # Load environment variables
+from config.bootstrap import load_env  # Load environment variables
 
-load_dotenv()
+load_env()
 
 # Import components
 from adapters.data.feed import DataFeed
@@ -185,6 +186,8 @@ class SystemOrchestrator:
         # Component references
         self.data_feed = None
         self.exchange_wrappers: Dict[str, Any] = {}
+        # Wrappers are async (ccxt.async_support); one loop keeps their shared aiohttp pool valid across calls
+        self._loop = asyncio.new_event_loop()
         self.market_context = None
         self.arbitrage_analyzer = None
         self.order_executor = None
@@ -365,6 +368,12 @@ class SystemOrchestrator:
 
         self.logger.info("✅ All system components initialized successfully")
 
+    def _run_async(self, result):
+        """Drive a wrapper coroutine to completion on the orchestrator's loop; plain values pass through."""
+        if inspect.isawaitable(result):
+            return self._loop.run_until_complete(result)
+        return result
+
     def _update_capital_mode(self):
         """Update capital allocation mode based on exchange balances."""
         try:
@@ -374,9 +383,9 @@ class SystemOrchestrator:
             for exchange_id, wrapper in self.exchange_wrappers.items():
                 try:
                     if hasattr(wrapper, 'get_balance'):
-                        balance_data = wrapper.get_balance()
+                        balance_data = self._run_async(wrapper.get_balance())
                     elif hasattr(wrapper, 'fetch_balance'):
-                        balance_data = wrapper.fetch_balance()
+                        balance_data = self._run_async(wrapper.fetch_balance())
                     else:
                         if self.trade_cycles % 10 == 0:  # Log less frequently
                             self.logger.debug(f"⚠️  No balance method found for {exchange_id}")
@@ -754,16 +763,13 @@ class SystemOrchestrator:
             except Exception as e:
                 self.logger.error(f"❌ Error stopping data feed: {e}")
 
-        for exchange_id, wrapper in self.exchange_wrappers.items():
-            try:
-                if hasattr(wrapper, 'disconnect'):
-                    wrapper.disconnect()
-                    self.logger.info(f"✅ {exchange_id} WebSocket disconnected")
-                elif hasattr(wrapper, 'close'):
-                    wrapper.close()
-                    self.logger.info(f"✅ {exchange_id} connection closed")
-            except Exception as e:
-                self.logger.error(f"❌ Error disconnecting {exchange_id}: {e}")
+        try:
+            # Closes each wrapper, then the aiohttp pool they share
+            self._run_async(ExchangeWrapperFactory.close_all_wrappers(self.exchange_wrappers))
+            self.logger.info("✅ Exchange connections closed")
+        except Exception as e:
+            self.logger.error(f"❌ Error closing exchange connections: {e}")
+        self._loop.close()
 
         self._log_session_summary()
         self.logger.info("👋 System shutdown complete. Goodbye!")
@@ -0,0 +1,24 @@
+import sys
+import types
+from decimal import Decimal
+
+import domain.values
+import utils.logger
+
+# The adapters import modules that live outside this tree (exchanges.*, a top-level logger)
+# and value names domain.values doesn't define yet - fill those in so their tests can import
+
+
+class ExchangeAdapter:
+    pass
+
+
+for _name in ('exchanges', 'exchanges.base', 'exchanges.wrappers'):
+    _module = sys.modules.setdefault(_name, types.ModuleType(_name))
+    if _name != 'exchanges':
+        _module.ExchangeAdapter = getattr(_module, 'ExchangeAdapter', ExchangeAdapter)
+sys.modules.setdefault('logger', utils.logger)
+
+for _name, _value in (('Symbol', str), ('Amount', Decimal)):
+    if not hasattr(domain.values, _name):
+        setattr(domain.values, _name, _value)
@@ -0,0 +1,110 @@
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('requests')
+pytest.importorskip('ccxt')
+
+from bot import A
+
+
+class _Exchange:
+    def __init__(self, ex_id, ask, coins):
+        self.id = ex_id
+        self.ask = ask
+        self.markets = {f'{c}/USDT': {} for c in coins}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sold = []
+        self._lock = threading.Lock()
+
+    def fetch_ticker(self, pair):
+        return {'ask': self.ask}
+
+    def create_market_buy_order(self, pair, amount):
+        pass
+
+    def create_market_sell_order(self, pair, amount):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+            self.sold.append(pair)
+
+
+class _Staking:
+    def stake_coin(self, ex, coin, amount):
+        return False
+
+    def unstake(self, ex, coin, amount):
+        pass
+
+
+_COINS = ['BTC', 'SOL', 'ADA', 'DOT', 'LINK', 'XRP']
+
+
+@pytest.fixture
+def bot(monkeypatch):
+    monkeypatch.setattr(A, 'log', lambda *messages: None)
+    exchanges = {'kraken': _Exchange('kraken', 10.0, _COINS + ['ETH']),
+                 'binanceus': _Exchange('binanceus', 11.0, _COINS + ['ETH'])}
+    bot = A.ABot({'exchanges': exchanges, 'a_bot_coins': _COINS, 'default_stake_coin': 'ETH'}, _Staking(), None)
+    bot.slot_size(60.0)
+    return bot
+
+
+def test_liquidate_sells_one_at_a_time_per_exchange(bot):
+    for coin in _COINS[:4]:
+        bot.handle_signal('buy', coin)
+    for coin in _COINS[:2]:
+        bot.venues[coin] = 'binanceus'  # Spread the book over both exchanges
+    bot.liquidate()
+
+    exchanges = bot.config['exchanges']
+    assert not bot.amounts
+    assert sorted(exchanges['kraken'].sold + exchanges['binanceus'].sold) == sorted(f'{c}/USDT' for c in _COINS[:4])
+    assert exchanges['kraken'].max_in_flight == 1
+    assert exchanges['binanceus'].max_in_flight == 1
+
+
+def test_buy_signal_is_skipped_when_slots_are_full(bot):
+    bot.manage_positions(60.0)  # Seat warmers
+    for coin in _COINS[1:]:
+        bot.handle_signal('buy', coin)
+    held = dict(bot.amounts)
+    assert len(held) == 6
+    bot.handle_signal('buy', 'BTC')
+    assert bot.amounts == held
+
+
+class _FailingExchange(_Exchange):
+    def fetch_ticker(self, pair):
+        raise TimeoutError('stalled')
+
+
+def test_best_buy_picks_the_lowest_ask_and_skips_a_failing_exchange(bot):
+    bot.config['exchanges']['coinbase'] = _FailingExchange('coinbase', 1.0, _COINS)
+    ex, ask = bot.best_buy('SOL')
+    assert (ex.id, ask) == ('kraken', 10.0)
+
+
+def test_ticker_lookups_are_cached(bot):
+    kraken = bot.config['exchanges']['kraken']
+    calls = []
+    kraken.fetch_ticker = lambda pair: calls.append(pair) or {'ask': 10.0}
+    bot.best_buy('SOL')
+    bot.best_buy('SOL')
+    assert calls == ['SOL/USDT']
+
+
+def test_positions_view_is_reused_until_a_position_changes(bot):
+    bot.handle_signal('buy', 'SOL')
+    view = bot.positions
+    assert bot.positions is view
+    assert view['SOL']['exchange'] == 'kraken'
+    bot.handle_signal('sell', 'SOL')
+    assert bot.positions is not view
+    assert 'SOL' not in bot.positions
@@ -0,0 +1,105 @@
+import json
+import statistics
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from domain import aggregates
+from domain.aggregates import ExchangeHealth, Portfolio
+from domain.entities import MacroSignal, TradingMode
+
+
+def _portfolio(*pnl):
+    portfolio = Portfolio()
+    for p in pnl:
+        portfolio.record_arbitrage_profit(Decimal(p))
+    return portfolio
+
+
+def test_sharpe_ratio_is_mean_over_population_stddev():
+    pnl = ['1.5', '-0.5', '2.25', '0.75', '-1']
+    floats = [float(p) for p in pnl]
+    expected = statistics.fmean(floats) / statistics.pstdev(floats)
+    assert abs(float(_portfolio(*pnl).get_sharpe_ratio()) - expected) < 1e-6
+
+
+def test_sharpe_ratio_is_zero_when_flat_or_short():
+    assert _portfolio('1', '1', '1').get_sharpe_ratio() == 0
+    assert _portfolio('1').get_sharpe_ratio() == 0
+
+
+def test_pnl_history_keeps_only_the_window():
+    portfolio = _portfolio(*['1'] * aggregates._PNL_WINDOW, '2')
+    assert len(portfolio.pnl_history) == aggregates._PNL_WINDOW
+    assert portfolio.pnl_history[-1] == Decimal('2')
+    assert portfolio.total_trades == aggregates._PNL_WINDOW + 1
+
+
+def test_checkpoint_round_trip():
+    portfolio = _portfolio('1.25', '-0.5', '3')
+    portfolio.gold_accumulated_this_cycle = Decimal('0.1')
+    portfolio.gold_target_this_cycle = Decimal('0.45')
+    portfolio.last_macro_switch = datetime.utcnow()
+    data = portfolio.to_dict()
+    assert data['last_macro_switch'] == portfolio.last_macro_switch.isoformat()
+
+    restored = Portfolio()
+    restored.restore_from_dict(json.loads(json.dumps(data)))
+    assert restored.to_dict() == data
+    assert list(restored.pnl_history) == list(portfolio.pnl_history)
+    assert restored.get_sharpe_ratio() == portfolio.get_sharpe_ratio()
+    assert restored.pnl_history.maxlen == aggregates._PNL_WINDOW
+    assert not restored._can_switch_macro()
+
+
+def test_heartbeat_moves_both_clocks():
+    health = ExchangeHealth('kraken', last_heartbeat=datetime.utcnow() - timedelta(minutes=5))
+    assert not health.is_alive()
+    health.beat(42)
+    assert health.is_alive()
+    assert health.api_response_time_ms == 42
+    assert datetime.utcnow() - health.last_heartbeat < timedelta(seconds=1)
+
+
+def test_monitor_heartbeat_updates_record_in_place():
+    pytest.importorskip('pandas')
+    pytest.importorskip('psutil')
+    from core.health_monitor import HealthMonitor
+    monitor = HealthMonitor.__new__(HealthMonitor)
+    monitor.exchange_health = {}
+    monitor.record_heartbeat('kraken', 10)
+    health = monitor.exchange_health['kraken']
+    health.errors_last_hour, health.is_healthy = 9, False
+    health.last_heartbeat_mono -= 120
+    monitor.record_heartbeat('kraken', 20)
+    assert monitor.exchange_health['kraken'] is health
+    assert health.is_alive() and health.errors_last_hour == 0
+    assert health.api_response_time_ms == 20
+
+
+def test_win_rate_is_exact():
+    portfolio = _portfolio('1', '-1', '2')
+    assert portfolio.get_win_rate() == Decimal(2) / Decimal(3)
+    assert Portfolio().get_win_rate() == 0
+
+
+def test_macro_switch_cooldown_uses_the_monotonic_stamp(monkeypatch):
+    now = [5000.0]
+    monkeypatch.setattr(aggregates.time, 'monotonic', lambda: now[0])
+    portfolio = _portfolio('100')
+    signal = MacroSignal(datetime.utcnow(), TradingMode.GOLD_MODE, Decimal('0.9'))
+    assert portfolio.update_macro_signal(signal)
+    assert portfolio.gold_target_this_cycle == Decimal('15.00')
+
+    now[0] += aggregates._MACRO_COOLDOWN - 1
+    portfolio.last_macro_switch -= timedelta(days=2)  # A wall-clock step must not open the cooldown
+    assert not portfolio.update_macro_signal(signal)
+    now[0] += 2
+    assert portfolio.update_macro_signal(signal)
+
+
+def test_restored_switch_falls_back_to_wall_clock():
+    portfolio = Portfolio()
+    portfolio.restore_from_dict({'last_macro_switch': (datetime.utcnow() - timedelta(days=2)).isoformat()})
+    assert portfolio._can_switch_macro()
@@ -0,0 +1,23 @@
+import os
+
+import pytest
+
+pytest.importorskip('dotenv')
+
+from config import bootstrap
+
+
+def test_load_env_reads_dotenv_from_cwd(tmp_path, monkeypatch):
+    (tmp_path / '.env').write_text('QB_BOOTSTRAP_PROBE=from-cwd\n')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('QB_BOOTSTRAP_PROBE', raising=False)
+    monkeypatch.setattr(bootstrap, '_LOADED', False)
+    monkeypatch.setattr(bootstrap, '_CONFIG_ENV', str(tmp_path / 'missing.env'))
+    bootstrap.load_env()
+    assert os.environ.pop('QB_BOOTSTRAP_PROBE') == 'from-cwd'
+
+
+def test_load_env_runs_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(bootstrap, '_LOADED', True)
+    monkeypatch.setattr(bootstrap, 'load_dotenv', lambda *a, **k: pytest.fail('reloaded .env'))
+    bootstrap.load_env()
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from adapters.exchanges import _breaker
+from adapters.exchanges._breaker import circuit_breaker
+
+
+class _Boom(Exception):
+    pass
+
+
+class _Adapter:
+    def __init__(self):
+        self.calls = {'fees': 0, 'book': 0}
+        self.fail = True
+
+    @circuit_breaker(default=lambda: 'default', errors=(_Boom,))
+    async def fees(self):
+        self.calls['fees'] += 1
+        if self.fail:
+            raise _Boom()
+        return 'live'
+
+    @circuit_breaker(default=lambda: 'default', errors=(_Boom,))
+    async def book(self):
+        self.calls['book'] += 1
+        return 'live'
+
+    @circuit_breaker(default=lambda: 'default', errors=(_Boom,))
+    async def broken(self):
+        raise KeyError('bug')
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_breaker.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def test_open_breaker_skips_calls_until_window_passes(clock):
+    adapter = _Adapter()
+    assert asyncio.run(adapter.fees()) == 'default'
+    assert asyncio.run(adapter.fees()) == 'default'
+    assert adapter.calls['fees'] == 1
+
+    clock[0] += 10
+    adapter.fail = False
+    assert asyncio.run(adapter.fees()) == 'live'
+    assert adapter.calls['fees'] == 2
+    assert not adapter._breakers
+
+
+def test_breaker_is_scoped_to_method_and_instance(clock):
+    tripped, other = _Adapter(), _Adapter()
+    asyncio.run(tripped.fees())
+    assert asyncio.run(tripped.book()) == 'live'
+    other.fail = False
+    assert asyncio.run(other.fees()) == 'live'
+
+
+def test_backoff_is_capped(clock):
+    adapter = _Adapter()
+    for _ in range(5):
+        asyncio.run(adapter.fees())
+        clock[0] += 30
+    assert adapter.calls['fees'] == 5
+
+
+def test_unlisted_errors_propagate(clock):
+    with pytest.raises(KeyError):
+        asyncio.run(_Adapter().broken())
+
+
+def test_failed_cancel_does_not_block_the_next_cancel():
+    kraken = pytest.importorskip('adapters.exchanges.kraken')
+    adapter = kraken.KrakenAdapter.__new__(kraken.KrakenAdapter)
+    calls = []
+
+    async def query_private(method, data):
+        calls.append(data['txid'])
+        if data['txid'] == 'bad':
+            raise kraken.KrakenAPIError('EOrder:Unknown order')
+        return {'result': {'count': 1}}
+
+    adapter._query_private = query_private
+    assert asyncio.run(adapter.cancel_order('bad', 'BTC/USD')) is False
+    assert asyncio.run(adapter.cancel_order('good', 'BTC/USD')) is True
+    assert calls == ['bad', 'good']
@@ -0,0 +1,24 @@
+from adapters.exchanges import _ccxt_json
+from adapters.exchanges._ccxt_json import OrjsonParseMixin
+
+
+class _Base:
+    def parse_json(self, http_response):
+        return ('fallback', http_response)
+
+
+class _Client(OrjsonParseMixin, _Base):
+    pass
+
+
+def test_valid_json_decodes_with_orjson():
+    if _ccxt_json.orjson is None:
+        assert _Client().parse_json('{"a": 1}') == ('fallback', '{"a": 1}')
+    else:
+        assert _Client().parse_json('{"a": 1}') == {'a': 1}
+
+
+def test_invalid_json_falls_back_to_ccxt(monkeypatch):
+    assert _Client().parse_json('<html>') == ('fallback', '<html>')
+    monkeypatch.setattr(_ccxt_json, 'orjson', None)
+    assert _Client().parse_json('{"a": 1}') == ('fallback', '{"a": 1}')
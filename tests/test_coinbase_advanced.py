@@ -0,0 +1,114 @@
+import asyncio
+import json
+from decimal import Decimal
+
+import pytest
+
+cba = pytest.importorskip('adapters.exchanges.coinbase_advanced')
+
+from adapters.exchanges._ws_book import LocalBooks
+
+
+class _Client:
+    def __init__(self):
+        self.fetched = []
+        self.batches = []
+        self.account_fetches = 0
+        self.cancel_reply = lambda ids: {'results': [{'order_id': i, 'success': True} for i in ids]}
+
+    async def fetch_order_book(self, product_id, limit):
+        self.fetched.append((product_id, limit))
+        return {'bids': [[99.0, 1.0]], 'asks': [[100.0, 2.0]]}
+
+    async def v3_private_post_brokerage_orders_batch_cancel(self, params):
+        self.batches.append(params['order_ids'])
+        return self.cancel_reply(params['order_ids'])
+
+    async def close(self):
+        pass
+
+    async def create_order(self, *args):
+        return {'id': 'o1'}
+
+    async def v3_private_get_brokerage_accounts(self, params):
+        self.account_fetches += 1
+        return {'accounts': [{'currency': 'USD', 'uuid': 'u', 'available_balance': {'value': '10'}}]}
+
+
+def _adapter():
+    adapter = cba.CoinbaseAdvancedAdapter.__new__(cba.CoinbaseAdvancedAdapter)
+    adapter.client = _Client()
+    adapter._books = LocalBooks()
+    adapter._cancel_queue = []
+    adapter._cancel_flush = None
+    adapter._acct_index = {}
+    adapter._acct_index_ts = 0.0
+    return adapter
+
+
+def _l2(kind, *updates):
+    return json.dumps({'channel': 'l2_data', 'events': [{'type': kind, 'product_id': 'BTC-USD', 'updates': [
+        {'side': side, 'price_level': price, 'new_quantity': qty} for side, price, qty in updates]}]})
+
+
+def test_order_book_reads_the_level2_feed_then_falls_back_to_rest():
+    adapter = _adapter()
+    adapter._on_l2_message(_l2('snapshot', ('bid', '50000.10', '1.5'), ('offer', '50000.20', '0.25')))
+    adapter._on_l2_message(_l2('update', ('bid', '50000.15', '2')))
+
+    book = asyncio.run(adapter.get_order_book('BTC/USD', 1))
+    assert book == {'bids': [{'price': Decimal('50000.15'), 'amount': Decimal('2')}],
+                    'asks': [{'price': Decimal('50000.20'), 'amount': Decimal('0.25')}]}
+    assert not adapter.client.fetched
+
+    adapter._books.reset(['BTC-USD'])  # What a feed disconnect does
+    book = asyncio.run(adapter.get_order_book('BTC/USD', 1))
+    assert book['asks'] == [{'price': Decimal('100.0'), 'amount': Decimal('2.0')}]
+    assert adapter.client.fetched == [('BTC-USD', 1)]
+
+
+def test_cancel_bursts_are_split_at_the_batch_limit():
+    adapter = _adapter()
+
+    async def run():
+        return await asyncio.gather(*(adapter.cancel_order(f'o{i}', 'BTC/USD') for i in range(250)))
+    assert all(asyncio.run(run()))
+    assert [len(ids) for ids in adapter.client.batches] == [100, 100, 50]
+
+
+def test_unexpected_cancel_reply_reaches_every_caller():
+    adapter = _adapter()
+    adapter.client.cancel_reply = lambda ids: None
+
+    async def run():
+        return await asyncio.gather(*(adapter.cancel_order(o, 'BTC/USD') for o in ('a', 'b')),
+                                    return_exceptions=True)
+    assert [type(r) for r in asyncio.run(run())] == [AttributeError, AttributeError]
+
+
+def test_close_resolves_queued_cancels():
+    adapter = _adapter()
+
+    async def run():
+        waiter = asyncio.create_task(adapter.cancel_order('a', 'BTC/USD'))
+        await asyncio.sleep(0)  # Queued, still inside the batching window
+        await adapter.close()
+        return await waiter
+    assert asyncio.run(run()) is False
+    assert not adapter.client.batches
+
+
+def test_orders_and_cancels_invalidate_the_account_index():
+    adapter = _adapter()
+
+    async def run():
+        await adapter.get_balance('USD')
+        await adapter.get_balance('USD')
+        assert adapter.client.account_fetches == 1
+        await adapter.place_order('BTC/USD', 'buy', Decimal('0.1'))
+        await adapter.get_balance('USD')
+        assert adapter.client.account_fetches == 2
+        await adapter.cancel_order('o1', 'BTC/USD')
+        assert await adapter.get_balance('USD') == Decimal('10')
+        assert adapter.client.account_fetches == 3
+    asyncio.run(run())
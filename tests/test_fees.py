@@ -0,0 +1,29 @@
+import asyncio
+from decimal import Decimal
+
+from adapters.exchanges import _fees
+from adapters.exchanges._fees import TradingFeeCache
+
+_DEFAULT = {'maker': Decimal('0.006'), 'taker': Decimal('0.012')}
+
+
+class _Client:
+    def __init__(self):
+        self.calls = 0
+
+    async def fetch_trading_fees(self):
+        self.calls += 1
+        return {'BTC/USD': {'maker': 0.004, 'taker': 0.006}}
+
+
+def test_fees_are_per_symbol_and_refreshed_after_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_fees.time, 'time', lambda: now[0])
+    client, cache = _Client(), TradingFeeCache(60, _DEFAULT)
+
+    assert asyncio.run(cache.get(client, 'BTC/USD')) == {'maker': Decimal('0.004'), 'taker': Decimal('0.006')}
+    assert asyncio.run(cache.get(client, 'ETH/USD')) is _DEFAULT
+    assert client.calls == 1
+    now[0] += 60
+    asyncio.run(cache.get(client, 'BTC/USD'))
+    assert client.calls == 2
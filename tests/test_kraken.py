@@ -0,0 +1,219 @@
+import asyncio
+import base64
+import contextlib
+import json
+from decimal import Decimal
+
+import pytest
+
+kraken = pytest.importorskip('adapters.exchanges.kraken')
+
+_SECRET = base64.b64encode(b'secret').decode()
+
+
+class _Response:
+    def __init__(self, payload):
+        self.payload = payload
+
+    async def json(self, loads=None):
+        return self.payload
+
+
+class _Session:
+    """Records what reaches the wire; replies with canned results"""
+
+    def __init__(self, public=None, private=None):
+        self.public = public or {}
+        self.private = private or {}
+        self.queried = []
+        self.sent = []
+        self.posted = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @contextlib.asynccontextmanager
+    async def post(self, url, data=None, headers=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.sent.append((headers['API-Key'], data['nonce']))
+        self.posted.append((url.rsplit('/', 1)[1], data))
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        yield _Response({'error': [], 'result': self.private.get(url.rsplit('/', 1)[1], {})})
+
+    @contextlib.asynccontextmanager
+    async def get(self, url, params=None):
+        method = url.rsplit('/', 1)[1]
+        self.queried.append((method, params))
+        if isinstance(self.public[method], Exception):
+            raise self.public[method]
+        yield _Response({'error': [], 'result': self.public[method]})
+
+
+_ASSET_PAIRS = {
+    'XXBTZUSD': {'altname': 'XBTUSD', 'wsname': 'XBT/USD', 'base': 'XXBT', 'quote': 'ZUSD',
+                 'pair_decimals': 1, 'lot_decimals': 8},
+    'XXBTZUSD.d': {'altname': 'XBTUSD.d', 'base': 'XXBT', 'quote': 'ZUSD',
+                   'pair_decimals': 1, 'lot_decimals': 8},
+    'XBTUSDT': {'altname': 'XBTUSDT', 'wsname': 'XBT/USDT', 'base': 'XXBT', 'quote': 'USDT',
+                'pair_decimals': 1, 'lot_decimals': 8},
+    'XDGUSD': {'altname': 'XDGUSD', 'wsname': 'XDG/USD', 'base': 'XXDG', 'quote': 'ZUSD',
+               'pair_decimals': 7, 'lot_decimals': 8},
+}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metadata(monkeypatch):
+    # Metadata caches are class-wide; ijson would read a real response stream
+    monkeypatch.setattr(kraken, 'ijson', None)
+    # domain.values.Price doesn't take the adapters' bare value yet
+    monkeypatch.setattr(kraken, 'Price', Decimal)
+    for attr in ('_pairs_cache', '_market_metadata_cache', '_asset_metadata_cache'):
+        monkeypatch.setattr(kraken.KrakenAdapter, attr, None)
+    for attr in ('_quantizers', '_pair_altnames', '_slots_by_key'):
+        monkeypatch.setattr(kraken.KrakenAdapter, attr, {})
+
+
+def _adapter(session, keys=(('k1', _SECRET),)):
+    adapter = kraken.KrakenAdapter({'api_key': keys[0][0], 'api_secret': keys[0][1], 'api_keys': list(keys)})
+
+    async def ensure_session():
+        return session
+    adapter._ensure_session = ensure_session
+    return adapter
+
+
+def test_private_calls_are_serialized_per_key():
+    session = _Session()
+    adapter = _adapter(session, keys=(('k1', _SECRET), ('k2', _SECRET)))
+
+    async def run():
+        await asyncio.gather(*(adapter._query_private('Balance') for _ in range(8)))
+    asyncio.run(run())
+
+    assert session.max_in_flight <= 2
+    for key in ('k1', 'k2'):
+        nonces = [n for k, n in session.sent if k == key]
+        assert nonces and nonces == sorted(nonces)
+
+
+def test_adapters_on_one_key_share_its_nonce_sequence():
+    session = _Session()
+    adapters = [_adapter(session), _adapter(session)]
+
+    async def run():
+        await asyncio.gather(*(a._query_private('Balance') for a in adapters for _ in range(4)))
+    asyncio.run(run())
+
+    nonces = [n for _, n in session.sent]
+    assert session.max_in_flight == 1
+    assert len(set(nonces)) == 8 and nonces == sorted(nonces)
+
+
+def test_ticker_keys_map_back_through_asset_pairs():
+    session = _Session({'AssetPairs': _ASSET_PAIRS, 'Ticker': {
+        'XXBTZUSD': {'c': ['50000.1', '1']},
+        'XBTUSDT': {'c': ['50001.2', '1']},
+        'XDGUSD': {'c': ['0.1234567', '1']},
+    }})
+    prices = asyncio.run(_adapter(session).get_ticker_prices(['BTC/USD', 'BTC/USDT', 'DOGE/USD']))
+
+    assert session.queried[-1] == ('Ticker', {'pair': 'XBTUSD,XBTUSDT,XDGUSD'})
+    assert {s: str(p) for s, p in prices.items()} == {
+        'BTC/USD': '50000.1', 'BTC/USDT': '50001.2', 'DOGE/USD': '0.1234567'}
+
+
+def test_ticker_reports_missing_symbols():
+    session = _Session({'AssetPairs': _ASSET_PAIRS, 'Ticker': {'XXBTZUSD': {'c': ['50000.1', '1']}}})
+    with pytest.raises(kraken.KrakenAPIError, match='BTC/USDT'):
+        asyncio.run(_adapter(session).get_ticker_prices(['BTC/USD', 'BTC/USDT']))
+
+
+def test_order_quantizers_resolve_through_altnames():
+    session = _Session({'AssetPairs': _ASSET_PAIRS})
+    adapter = _adapter(session)
+    asyncio.run(adapter.place_order('BTC/USDT', 'buy', Decimal('0.123456789'), Decimal('50000.15')))
+    method, data = session.posted[-1]
+    assert method == 'AddOrder'
+    assert (data['pair'], data['volume'], data['price']) == ('BTCUSDT', '0.12345678', '50000.2')
+
+
+def test_orders_go_out_unquantized_when_asset_pairs_fails():
+    session = _Session({'AssetPairs': kraken.aiohttp.ClientError('down')})
+    asyncio.run(_adapter(session).place_order('BTC/USDT', 'sell', Decimal('0.123456789'), Decimal('50000.15')))
+    _, data = session.posted[-1]
+    assert (data['volume'], data['price']) == ('0.123456789', '50000.15')
+
+
+def test_depth_reads_the_pushed_book_then_falls_back_to_rest():
+    session = _Session({'Depth': {'XXBTZUSD': {'bids': [['99.0', '1.0', 1]], 'asks': [['100.0', '1.0', 1]]}}})
+    adapter = _adapter(session)
+    adapter._on_book_message(json.dumps({'channel': 'book', 'type': 'snapshot', 'data': [
+        {'symbol': 'BTC/USD', 'bids': [{'price': 50000.1, 'qty': 1.5}], 'asks': [{'price': 50000.2, 'qty': 0.25}]}]}))
+
+    assert asyncio.run(adapter._depth('BTC/USD', 1)) == {
+        'bids': [['50000.1', '1.5', 0]], 'asks': [['50000.2', '0.25', 0]]}
+    assert not session.queried
+
+    adapter._books.reset(['BTC/USD'])  # What a feed disconnect does
+    assert asyncio.run(adapter._depth('BTC/USD', 1))['bids'] == [['99.0', '1.0', 1]]
+    assert session.queried == [('Depth', {'pair': 'BTCUSD', 'count': 1})]
+
+
+def test_call_counter_waits_out_the_decay(monkeypatch):
+    now = [100.0]
+    slept = []
+
+    async def sleep(delay):
+        slept.append(delay)
+        now[0] += delay
+    monkeypatch.setattr(kraken.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(kraken.asyncio, 'sleep', sleep)
+
+    counter = kraken._CallCounter(capacity=2, decay=0.5)
+
+    async def drive():
+        await counter.acquire(1)
+        await counter.acquire(1)
+        await counter.acquire(1)
+    asyncio.run(drive())
+    assert slept == [2.0]  # One unit over capacity at 0.5/s
+    assert counter.level == 2.0
+
+
+def test_get_order_maps_status_and_average_price():
+    session = _Session({'AssetPairs': _ASSET_PAIRS}, {'QueryOrders': {'O1': {
+        'status': 'expired', 'vol': '0.3', 'vol_exec': '0.2', 'cost': '10000.03', 'fee': '0.4'}}})
+    order = asyncio.run(_adapter(session).get_order('O1', 'BTC/USD'))
+    assert order == {'id': 'O1', 'status': 'canceled', 'filled': Decimal('0.2'), 'remaining': Decimal('0.1'),
+                     'avg_price': Decimal('50000.2'), 'fee': Decimal('0.4')}
+
+
+def test_get_order_reports_an_unknown_txid():
+    session = _Session({'AssetPairs': _ASSET_PAIRS})
+    order = asyncio.run(_adapter(session).get_order('O2', 'BTC/USD'))
+    assert order['id'] == 'O2' and order['status'] == 'unknown'
+
+
+def test_fees_are_cached_until_the_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(kraken.time, 'time', lambda: now[0])
+    session = _Session(private={'TradeVolume': {'fees': {'XXBTZUSD': {'fee': '0.26'}},
+                                                'fees_maker': {'XXBTZUSD': {'fee': '0.16'}}}})
+    adapter = _adapter(session)
+
+    assert asyncio.run(adapter.fetch_fees('BTC/USD')) == {'maker': Decimal('0.0016'), 'taker': Decimal('0.0026')}
+    asyncio.run(adapter.fetch_fees('BTC/USD'))
+    assert [m for m, _ in session.posted] == ['TradeVolume']
+    now[0] += kraken._FEES_TTL
+    asyncio.run(adapter.fetch_fees('BTC/USD'))
+    assert [m for m, _ in session.posted] == ['TradeVolume', 'TradeVolume']
+
+
+def test_numpy_book_reads_the_pushed_levels():
+    adapter = _adapter(_Session())
+    adapter._on_book_message(json.dumps({'channel': 'book', 'type': 'snapshot', 'data': [
+        {'symbol': 'BTC/USD', 'bids': [{'price': 50000.1, 'qty': 1.5}], 'asks': [{'price': 50000.2, 'qty': 0.25}]}]}))
+    book = asyncio.run(adapter.get_order_book_np('BTC/USD', 1))
+    assert book['bids'].tolist() == [[50000.1, 1.5]]
+    assert book['asks'].tolist() == [[50000.2, 0.25]]
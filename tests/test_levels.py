@@ -0,0 +1,15 @@
+import numpy as np
+
+from adapters.exchanges._levels import levels_array
+
+
+def test_kraken_rows_drop_the_timestamp_column():
+    out = levels_array([['50000.1', '1.5', 1700000000], ['49999.9', '0.25', 1700000001]], 3)
+    assert out.dtype == np.float64
+    assert out.tolist() == [[50000.1, 1.5], [49999.9, 0.25]]
+
+
+def test_ccxt_rows_and_empty_sides():
+    assert levels_array([[100.0, 2.0]], 2).tolist() == [[100.0, 2.0]]
+    assert levels_array([], 2).shape == (0, 2)
+    assert levels_array([], 3).shape == (0, 2)
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+
+main = pytest.importorskip('main')
+
+
+class _AsyncWrapper:
+    def __init__(self):
+        self.closed = False
+
+    async def get_balance(self):
+        await asyncio.sleep(0)
+        return {'total': {'USD': 0.0, 'USDT': 250.0}}
+
+    async def close(self):
+        self.closed = True
+
+
+def _orchestrator():
+    orchestrator = main.SystemOrchestrator.__new__(main.SystemOrchestrator)
+    orchestrator._loop = asyncio.new_event_loop()
+    return orchestrator
+
+
+def test_run_async_awaits_wrapper_coroutines():
+    orchestrator = _orchestrator()
+    assert orchestrator._run_async(_AsyncWrapper().get_balance())['total']['USDT'] == 250.0
+    assert orchestrator._run_async({'total': {}}) == {'total': {}}
+    orchestrator._loop.close()
+
+
+def test_close_all_wrappers_runs_on_the_orchestrator_loop():
+    orchestrator = _orchestrator()
+    wrapper = _AsyncWrapper()
+    orchestrator._run_async(main.ExchangeWrapperFactory.close_all_wrappers({'kraken': wrapper}))
+    assert wrapper.closed
+    orchestrator._loop.close()
@@ -0,0 +1,22 @@
+from decimal import Decimal
+
+from adapters.exchanges._prices import LastPriceCache
+
+
+def test_repeated_last_price_reuses_the_decimal():
+    cache = LastPriceCache()
+    first = cache.decimal('BTC-USD', '50000.10')
+    assert first == Decimal('50000.10')
+    assert cache.decimal('BTC-USD', '50000.10') is first
+    assert cache.decimal('BTC-USD', '50000.2') == Decimal('50000.2')
+
+
+def test_markets_are_cached_independently():
+    cache = LastPriceCache()
+    cache.decimal('BTC-USD', '1')
+    assert cache.decimal('ETH-USD', '2') == Decimal('2')
+    assert cache.decimal('BTC-USD', '1') == Decimal('1')
+
+
+def test_floats_parse_to_their_short_form():
+    assert LastPriceCache().decimal('BTCUSDT', 67000.1) == Decimal('67000.1')
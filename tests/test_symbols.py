@@ -0,0 +1,7 @@
+from adapters.exchanges._symbols import product_id
+
+
+def test_product_id_swaps_the_separator():
+    assert product_id('BTC/USD') == 'BTC-USD'
+    assert product_id('1INCH/USDT') == '1INCH-USDT'
+    assert product_id('BTC-USD') == 'BTC-USD'
@@ -0,0 +1,94 @@
+import asyncio
+import contextlib
+
+import pytest
+
+pytest.importorskip('websockets')
+
+from adapters.exchanges import _ws_book
+from adapters.exchanges._ws_book import LocalBooks
+
+
+def test_snapshot_then_updates():
+    books = LocalBooks()
+    books.apply('BTC-USD', [('100.5', '1'), ('100', '2')], [('101', '3')], snapshot=True)
+    books.apply('BTC-USD', [('100.5', '0'), ('99', '4')], [('100.75', '1')])
+    assert books.top('BTC-USD', 5) == ([('100', '2'), ('99', '4')], [('100.75', '1'), ('101', '3')])
+    assert books.top('BTC-USD', 1) == ([('100', '2')], [('100.75', '1')])
+
+
+def test_updates_before_snapshot_are_ignored():
+    books = LocalBooks()
+    books.apply('BTC-USD', [('100', '1')], [])
+    assert books.top('BTC-USD', 5) is None
+
+
+def test_depth_cap_drops_levels_pushed_out_of_range():
+    books = LocalBooks(depth=2)
+    books.apply('XBT/USD', [('3', '1'), ('2', '1'), ('1', '1')], [('4', '1'), ('5', '1'), ('6', '1')], snapshot=True)
+    assert books.top('XBT/USD', 10) == ([('3', '1'), ('2', '1')], [('4', '1'), ('5', '1')])
+
+
+def test_reset_only_touches_the_given_markets():
+    books = LocalBooks()
+    books.apply('A', [('1', '1')], [('2', '1')], snapshot=True)
+    books.apply('B', [('1', '1')], [('2', '1')], snapshot=True)
+    books.reset(['A'])
+    assert books.top('A', 1) is None
+    assert books.top('B', 1) is not None
+
+
+class _Socket:
+    def __init__(self, messages):
+        self.messages = messages
+        self.sent = []
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def __aiter__(self):
+        for message in self.messages:
+            yield message
+        raise OSError('connection reset')
+
+
+def test_disconnect_resets_the_book(monkeypatch):
+    socket = _Socket(['snapshot'])
+    monkeypatch.setattr(_ws_book.websockets, 'connect', lambda uri, **kw: contextlib.nullcontext(socket))
+    books = LocalBooks()
+    warm = []
+
+    def on_message(message):
+        books.apply('BTC-USD', [('100', '1')], [('101', '1')], snapshot=True)
+        warm.append(books.top('BTC-USD', 1))
+
+    async def run():
+        books.start('wss://feed', 'subscribe', ['BTC-USD'], on_message, reconnect=3600)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert socket.sent == ['subscribe']
+        assert warm == [([('100', '1')], [('101', '1')])]
+        assert books.top('BTC-USD', 1) is None  # Dropped on disconnect - callers use REST
+        books.stop()
+    asyncio.run(run())
+
+
+
+def test_bad_message_resets_the_book_and_keeps_the_feed(monkeypatch):
+    socket = _Socket(['snapshot', 'garbage'])
+    monkeypatch.setattr(_ws_book.websockets, 'connect', lambda uri, **kw: contextlib.nullcontext(socket))
+    books = LocalBooks()
+
+    def on_message(message):
+        if message == 'garbage':
+            raise ValueError('Expecting value')
+        books.apply('BTC-USD', [('100', '1')], [('101', '1')], snapshot=True)
+
+    async def run():
+        books.start('wss://feed', 'subscribe', ['BTC-USD'], on_message, reconnect=0)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert socket.sent.count('subscribe') > 1  # Resubscribed instead of the task dying
+        assert not books._task.done()
+        books.stop()
+    asyncio.run(run())
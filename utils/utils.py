@@ -1,19 +1,21 @@
 import os
 import time
-from dotenv import load_dotenv
+from config.bootstrap import load_env
 import ccxt
 
 shared_state = {'mode': 'GOLD', 'pnl': 0, 'paxg_cold': 0, 'alerts': []}
 
 
-def log(message):
+def log(*messages):
+    # Several messages share one open/append/close of the log file
+    stamp = time.ctime()
     with open('logs/quant.log', 'a') as f:
-        f.write(f"{time.ctime()}: {message}\n")
-    shared_state['alerts'].append(message)
+        f.write(''.join(f"{stamp}: {message}\n" for message in messages))
+    shared_state['alerts'].extend(messages)
 
 
 def load_config():
-    load_dotenv('../config/.env')
+    load_env()
 
     # Safe defaults if .env missing/empty
     min_profit = float(os.getenv('MIN_PROFIT_THRESHOLD', '0.15'))